@@ -1,22 +1,117 @@
 import os
 import sys
+import time
+import asyncio
+import inspect
+import importlib
 import types
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from . import util
 from . import errors
 from . import logger
 from .envManager import env
+from .events import EventBus
+from .router import Router
+from .httpClient import HttpClient
+from .manifest import ModuleManifest, validate_module, module_signature, module_digest
 
 sdk = types.SimpleNamespace()
 setattr(sdk, "env", env)
 setattr(sdk, "logger", logger)
 setattr(sdk, "util", util)
+setattr(sdk, "events", EventBus())
+setattr(sdk, "router", Router())
+# 共享的 HTTP 会话，连接池与超时配置在第一次请求时从 env 读取
+setattr(sdk, "http", HttpClient(env.get))
 
-env.load_env_file()
+# 共享线程池/进程池的大小在第一次使用时从 env 读取
+util.pools.settings = env.get
 
-def init():
+sdkModulePath = os.path.join(os.path.dirname(__file__), "modules")
+
+# init() 记录的模块依赖层级（模块名称），供 init_async() 启动与 shutdown() 逆序停止使用
+_moduleLevels: list[list[str]] = []
+_startedModules: set[str] = set()
+_eventLoop = None
+# init_async() 完成后设置：之后才构造的延迟加载模块在该事件循环中调用 start()
+_startLoop = None
+_startingModules = {}
+_pendingStarts = set()
+
+# init() 记录的已加载模块（以目录名为键）：模块对象、moduleInfo、依赖与延迟加载占位对象，供 reload() 使用
+_moduleObjs = {}
+_loadedModules: dict[str, dict] = {}
+_moduleGraph = util.DependencyGraph(error=errors.CycleDependencyError)
+_moduleProxies = {}
+_reloadLock = threading.RLock()
+_moduleWatchStop = threading.Event()
+_moduleWatcher = None
+
+# 最近一次 init() 的分阶段与逐模块耗时，由 startup_report() 整理输出
+_startupProfile = {}
+
+def _timed(func, *args):
+    # 返回 (结果, 异常, 耗时秒数)，供并行初始化在线程池中调用
+    start = time.perf_counter()
+    try:
+        return func(*args), None, time.perf_counter() - start
+    except Exception as e:
+        return None, e, time.perf_counter() - start
+
+class LazyModule:
+    # 延迟加载模式下 sdk.<模块名> 的占位对象，第一次访问属性时才构造模块（依赖优先）
+    def __init__(self, name, loader):
+        object.__setattr__(self, "_lazy_name", name)
+        object.__setattr__(self, "_lazy_loader", loader)
+        object.__setattr__(self, "_lazy_instance", None)
+        object.__setattr__(self, "_lazy_lock", threading.RLock())
+
+    def _lazy_load(self):
+        instance = self._lazy_instance
+        if instance is None:
+            with self._lazy_lock:
+                if self._lazy_instance is None:
+                    object.__setattr__(self, "_lazy_instance", self._lazy_loader())
+                instance = self._lazy_instance
+        return instance
+
+    def __getattr__(self, name):
+        return getattr(self._lazy_load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._lazy_load(), name, value)
+
+    def __repr__(self):
+        state = "loaded" if self._lazy_instance is not None else "not loaded"
+        return f"<LazyModule {self._lazy_name} ({state})>"
+
+def _env_flag(name):
+    return os.environ.get(name, "").lower() in ("1", "true", "yes")
+
+def init(parallel=None, max_workers=None, lazy=None):
+    # parallel / lazy 为 None 时读取环境变量 ERISPULSE_PARALLEL_INIT / ERISPULSE_LAZY_INIT
+    if parallel is None:
+        parallel = _env_flag("ERISPULSE_PARALLEL_INIT")
+    if lazy is None:
+        lazy = _env_flag("ERISPULSE_LAZY_INIT")
+    pool = None
+    initStart = time.perf_counter()
+    phaseTimes = {}
+    discoveryTimes = {}
+    resolveTimes = {}
+    importTimes = {}
+    constructTimes = {}
+    moduleStates = {}
+    cachedModules = set()
+    _startupProfile.clear()
+    _startupProfile.update(
+        parallel=bool(parallel), lazy=bool(lazy), phases=phaseTimes, discovery=discoveryTimes,
+        resolve=resolveTimes, imports=importTimes, construct=constructTimes, states=moduleStates,
+        cached=cachedModules, names={}, total=None
+    )
     try:
-        sdkModulePath = os.path.join(os.path.dirname(__file__), "modules")
-        
+        discoveryStart = time.perf_counter()
         if not os.path.exists(sdkModulePath):
             os.makedirs(sdkModulePath)
 
@@ -26,53 +121,107 @@ def init():
             x for x in os.listdir(sdkModulePath)
             if os.path.isdir(os.path.join(sdkModulePath, x))
         ]
+        # 依赖检查使用集合，避免模块较多时逐个扫描列表
+        availableModules = set(TempModules)
 
         sdkInstalledModuleNames: list[str] = []
-        disabledModules: list[str] = []
+        disabledModules: set[str] = set()
+        moduleObjs = _moduleObjs
+        moduleObjs.clear()
+        moduleInfos = {}
+        pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ErisPulse-init") if parallel else None
 
+        # 一次性读取模块注册表，后续只在内存中比较，最后统一写回变化的行
+        dbStart = time.perf_counter()
+        registeredModules = env.get_all_modules()
+        manifest = ModuleManifest(env, sdkModulePath)
+        dbElapsed = time.perf_counter() - dbStart
+        newModules: list[str] = []
+
+        # 清单缓存命中的模块无需导入即可读取 moduleInfo，只导入缓存未命中的模块以及已启用且需要立即构造的模块
+        cachedEntries = {}
         for module_name in TempModules:
-            try:
-                moduleObj = __import__(module_name)
-                if not hasattr(moduleObj, "moduleInfo") or not isinstance(moduleObj.moduleInfo, dict):
-                    logger.warning(f"模块 {module_name} 缺少有效的 'moduleInfo' 字典.")
-                    continue
-                if "name" not in moduleObj.moduleInfo.get("meta", {}):
-                    logger.warning(f"模块 {module_name} 的 'moduleInfo' 字典 缺少必要 'name' 键.")
+            lookupStart = time.perf_counter()
+            cachedEntries[module_name] = manifest.lookup(module_name)
+            discoveryTimes[module_name] = time.perf_counter() - lookupStart
+            if cachedEntries[module_name] is not None:
+                cachedModules.add(module_name)
+        toImport = []
+        for module_name in TempModules:
+            entry = cachedEntries[module_name]
+            if entry is None:
+                toImport.append(module_name)
+            elif entry["info"] is not None:
+                module_info = registeredModules.get(entry["info"]["meta"]["name"])
+                if module_info is not None and not module_info.get("status", True):
                     continue
-                if not hasattr(moduleObj, "Main"):
-                    logger.warning(f"模块 {module_name} 缺少 'Main' 类.")
+                if not lazy or entry["info"].get("eager", False):
+                    toImport.append(module_name)
+
+        phaseTimes["discovery"] = time.perf_counter() - discoveryStart - dbElapsed
+
+        # 并行模式下在线程池中同时导入；moduleInfo 只有导入后才能读取，因此导入阶段不分层
+        importStart = time.perf_counter()
+        if parallel:
+            imported = dict(zip(toImport, pool.map(_timed, [__import__] * len(toImport), toImport)))
+        else:
+            imported = {module_name: _timed(__import__, module_name) for module_name in toImport}
+        importWall = time.perf_counter() - importStart
+        phaseTimes["import"] = importWall
+
+        resolveStart = time.perf_counter()
+        for module_name in TempModules:
+            moduleStart = time.perf_counter()
+            moduleStates[module_name] = "failed"
+            try:
+                if module_name in imported:
+                    moduleObj, error, importTimes[module_name] = imported[module_name]
+                    if error is not None:
+                        raise error
+                    moduleObjs[module_name] = moduleObj
+                    moduleInfo, warning = validate_module(module_name, moduleObj)
+                    if cachedEntries[module_name] is None:
+                        manifest.record(module_name, moduleInfo, warning)
+                else:
+                    moduleInfo, warning = cachedEntries[module_name]["info"], cachedEntries[module_name]["warning"]
+                if warning:
+                    moduleStates[module_name] = "invalid"
+                    logger.warning(warning)
                     continue
                 
-                module_info = env.get_module(moduleObj.moduleInfo.get("meta", {}).get("name", None))
+                meta_name = moduleInfo.get("meta", {}).get("name", None)
+                _startupProfile["names"][module_name] = meta_name
+                module_info = registeredModules.get(meta_name)
                 if module_info is None:
                     module_info = {
                         "status": True,
-                        "info": moduleObj.moduleInfo
+                        "info": moduleInfo
                     }
-                    env.set_module(moduleObj.moduleInfo.get("meta", {}).get("name", None), module_info)
-                    logger.info(f"模块 {moduleObj.moduleInfo.get("meta", {}).get("name", None)} 信息已初始化并存储到数据库")
+                    registeredModules[meta_name] = module_info
+                    newModules.append(meta_name)
                 
                 if not module_info.get('status', True):
-                    disabledModules.append(module_name)
-                    logger.warning(f"模块 {moduleObj.moduleInfo.get("meta", {}).get("name", None)} 已禁用，跳过加载")
+                    moduleStates[module_name] = "disabled"
+                    disabledModules.add(module_name)
+                    logger.warning(f"模块 {meta_name} 已禁用，跳过加载")
                     continue
                     
-                required_deps = moduleObj.moduleInfo.get("dependencies", []).get("requires", [])
-                missing_required_deps = [dep for dep in required_deps if dep not in TempModules]
+                required_deps = moduleInfo.get("dependencies", []).get("requires", [])
+                missing_required_deps = [dep for dep in required_deps if dep not in availableModules]
                 if missing_required_deps:
                     logger.error(f"模块 {module_name} 缺少必需依赖: {missing_required_deps}")
                     raise errors.MissingDependencyError(f"模块 {module_name} 缺少必需依赖: {missing_required_deps}")
 
                 # 检查可选依赖部分
-                optional_deps = moduleObj.moduleInfo.get("dependencies", []).get("optional", [])
+                optional_deps = moduleInfo.get("dependencies", []).get("optional", [])
                 if optional_deps:
                     available_optional_deps = []
                     for dep in optional_deps:
                         if isinstance(dep, list):
-                            available_deps = [d for d in dep if d in TempModules]
+                            available_deps = [d for d in dep if d in availableModules]
                             if available_deps:
                                 available_optional_deps.extend(available_deps)
-                        elif dep in TempModules:
+                        elif dep in availableModules:
                             available_optional_deps.append(dep)
 
                     if available_optional_deps:
@@ -81,17 +230,23 @@ def init():
                         logger.warning(f"模块 {module_name} 缺少所有可选依赖: {optional_deps}")
 
                 sdkInstalledModuleNames.append(module_name)
+                moduleInfos[module_name] = moduleInfo
+                moduleStates[module_name] = "enabled"
             except Exception as e:
                 logger.warning(f"模块 {module_name} 加载失败: {e}")
                 continue
+            finally:
+                resolveTimes[module_name] = time.perf_counter() - moduleStart
 
-        sdkModuleDependencies = {}
+        dependencyGraph = _moduleGraph
+        dependencyGraph.clear()
+        installedModules = set(sdkInstalledModuleNames)
         for module_name in sdkInstalledModuleNames:
-            moduleObj = __import__(module_name)
-            moduleDependecies: list[str] = moduleObj.moduleInfo.get("dependencies", []).get("requires", [])
+            moduleInfo = moduleInfos[module_name]
+            moduleDependecies: list[str] = list(moduleInfo.get("dependencies", []).get("requires", []))
 
-            optional_deps = moduleObj.moduleInfo.get("dependencies", []).get("optional", [])
-            available_optional_deps = [dep for dep in optional_deps if dep in sdkInstalledModuleNames]
+            optional_deps = moduleInfo.get("dependencies", []).get("optional", [])
+            available_optional_deps = [dep for dep in optional_deps if isinstance(dep, str) and dep in installedModules]
             moduleDependecies.extend(available_optional_deps)
 
             for dep in moduleDependecies:
@@ -99,41 +254,456 @@ def init():
                     logger.warning(f"模块 {module_name} 的依赖模块 {dep} 已禁用，跳过加载")
                     continue
             
-            if not all(dep in sdkInstalledModuleNames for dep in moduleDependecies):
+            if not all(dep in installedModules for dep in moduleDependecies):
                 raise errors.InvalidDependencyError(
                     f"模块 {module_name} 的依赖无效: {moduleDependecies}"
                 )
-            sdkModuleDependencies[module_name] = moduleDependecies
+            dependencyGraph.add(module_name, moduleDependecies)
 
-        sdkInstalledModuleNames: list[str] = sdk.util.topological_sort(
-            sdkInstalledModuleNames, sdkModuleDependencies, errors.CycleDependencyError
-        )
+        # 存在循环依赖时抛出 CycleDependencyError，消息中包含环的路径
+        dependencyLevels = dependencyGraph.levels()
+        sdkInstalledModuleNames = [module_name for level in dependencyLevels for module_name in level]
+        if parallel:
+            moduleLevels = dependencyLevels
+        else:
+            moduleLevels = [[module_name] for module_name in sdkInstalledModuleNames]
+        _moduleLevels[:] = [
+            [moduleInfos[module_name].get("meta", {}).get("name", None) for module_name in level]
+            for level in dependencyLevels
+        ]
+        _loadedModules.clear()
+        _loadedModules.update((module_name, moduleInfos[module_name]) for module_name in sdkInstalledModuleNames)
+
+        phaseTimes["dependencies"] = time.perf_counter() - resolveStart
 
+        dbStart = time.perf_counter()
         all_modules_info = {}
         for module_name in sdkInstalledModuleNames:
-            moduleObj = __import__(module_name)
-            moduleInfo: dict = moduleObj.moduleInfo
-
-            module_info = env.get_module(moduleInfo.get("meta", {}).get("name", None))
-            env.set_module(moduleInfo.get("meta", {}).get("name", None), {
+            moduleInfo: dict = moduleInfos[module_name]
+            all_modules_info[moduleInfo.get("meta", {}).get("name", None)] = {
                 "status": True,
                 "info": moduleInfo
-            })
+            }
+        for meta_name in newModules:
+            all_modules_info.setdefault(meta_name, registeredModules[meta_name])
+        # set_all_modules 只写入与数据库不一致的行，并在同一个事务中提交
+        env.set_all_modules(all_modules_info)
+        manifest.save(TempModules)
+        phaseTimes["db_sync"] = dbElapsed + time.perf_counter() - dbStart
+        for meta_name in newModules:
+            logger.info(f"模块 {meta_name} 信息已初始化并存储到数据库")
         logger.debug("所有模块信息已加载并存储到数据库")
 
-        for module_name in sdkInstalledModuleNames:
-            moduleObj = __import__(module_name)
-            moduleInfo = moduleObj.moduleInfo
-            module_status = env.get_module_status(moduleInfo.get("meta", {}).get("name", None))
-            if not module_status:
-                continue
-            
-            moduleMain = moduleObj.Main(sdk)
+        proxies = _moduleProxies
+        proxies.clear()
+
+        def mainClass(module_name):
+            # 延迟加载模式下模块在第一次构造时才导入
+            moduleObj = moduleObjs.get(module_name)
+            if moduleObj is None:
+                moduleObj, error, importTimes[module_name] = _timed(__import__, module_name)
+                if error is not None:
+                    raise error
+                moduleObjs[module_name] = moduleObj
+            return moduleObj.Main
+
+        def register(module_name, moduleMain, elapsed):
+            constructTimes[module_name] = elapsed
+            moduleInfo = _loadedModules[module_name]
+            meta_name = moduleInfo.get("meta", {}).get("name", None)
             setattr(moduleMain, "moduleInfo", moduleInfo)
-            setattr(sdk, moduleInfo.get("meta", {}).get("name", None), moduleMain)
-            logger.debug(f"模块 {moduleInfo.get("meta", {}).get("name", None)} 正在初始化")
+            setattr(sdk, meta_name, moduleMain)
+            if module_name in proxies:
+                object.__setattr__(proxies[module_name], "_lazy_instance", moduleMain)
+            logger.debug(f"模块 {meta_name} 初始化完成，耗时 {elapsed * 1000:.1f}ms")
+            _schedule_start(module_name)
+            return moduleMain
+
+        def load(module_name):
+            # reload() 可能修改依赖，因此读取模块级的依赖图
+            for dep in _moduleGraph.dependencies(module_name):
+                proxies[dep]._lazy_load()
+            moduleMain, error, elapsed = _timed(mainClass(module_name), sdk)
+            if error is not None:
+                raise error
+            return register(module_name, moduleMain, elapsed)
+
+        # 延迟加载模式下先为所有模块放置占位对象，只有 moduleInfo 中 eager 为 True 的模块（及其依赖）立即构造
+        eagerModules = set(sdkInstalledModuleNames)
+        if lazy:
+            eagerModules = set()
+            for module_name in sdkInstalledModuleNames:
+                if moduleInfos[module_name].get("eager", False):
+                    eagerModules.add(module_name)
+                    eagerModules.update(dependencyGraph.all_dependencies(module_name))
+            for module_name in sdkInstalledModuleNames:
+                meta_name = moduleInfos[module_name].get("meta", {}).get("name", None)
+                proxies[module_name] = LazyModule(meta_name, lambda module_name=module_name: load(module_name))
+                setattr(sdk, meta_name, proxies[module_name])
+
+        # 逐层构造：同一层的模块互不依赖，并行模式下在线程池中同时构造，整层完成后再进入下一层
+        constructStart = time.perf_counter()
+        for level in moduleLevels:
+            level = [module_name for module_name in level if module_name in eagerModules]
+            if parallel and len(level) > 1:
+                results = list(pool.map(_timed, [mainClass(module_name) for module_name in level], [sdk] * len(level)))
+            else:
+                results = [_timed(mainClass(module_name), sdk) for module_name in level]
+            for module_name, (moduleMain, error, elapsed) in zip(level, results):
+                if error is not None:
+                    raise error
+                register(module_name, moduleMain, elapsed)
+        constructWall = time.perf_counter() - constructStart
+        phaseTimes["construct"] = constructWall
+        if lazy:
+            logger.debug(f"延迟加载模式: {len(eagerModules)} 个模块已构造，{len(sdkInstalledModuleNames) - len(eagerModules)} 个模块将在首次访问时构造")
+
+        if parallel:
+            serialTime = sum(importTimes.values()) + sum(constructTimes.values())
+            parallelTime = importWall + constructWall
+            logger.info(
+                f"并行初始化 {len(sdkInstalledModuleNames)} 个模块（{len(moduleLevels)} 层）: "
+                f"导入 {importWall * 1000:.1f}ms / 串行累计 {sum(importTimes.values()) * 1000:.1f}ms，"
+                f"构造 {constructWall * 1000:.1f}ms / 串行累计 {sum(constructTimes.values()) * 1000:.1f}ms，"
+                f"节省约 {(serialTime - parallelTime) * 1000:.1f}ms"
+            )
+
+        if _env_flag("ERISPULSE_WATCH_MODULES"):
+            watch_modules()
     except Exception as e:
         logger.error(f"初始化失败: {e}")
         raise e
+    finally:
+        _startupProfile["total"] = time.perf_counter() - initStart
+        logger.debug(f"初始化耗时 {_startupProfile['total'] * 1000:.1f}ms")
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+def startup_report():
+    # 最近一次 init() 的耗时报告（秒），模块按合计耗时降序排列；延迟加载的模块在首次访问后才有导入与构造耗时
+    if not _startupProfile:
+        return None
+    modules = []
+    for module_name, state in _startupProfile["states"].items():
+        if state == "enabled":
+            if module_name in _startupProfile["construct"]:
+                state = "loaded"
+            elif module_name in _moduleProxies:
+                state = "lazy"
+        times = {
+            "discovery": _startupProfile["discovery"].get(module_name, 0.0),
+            "import": _startupProfile["imports"].get(module_name),
+            "resolve": _startupProfile["resolve"].get(module_name, 0.0),
+            "construct": _startupProfile["construct"].get(module_name),
+        }
+        modules.append({
+            "module": module_name,
+            "name": _startupProfile["names"].get(module_name),
+            "status": state,
+            "cached": module_name in _startupProfile["cached"],
+            **times,
+            "total": sum(value for value in times.values() if value is not None),
+        })
+    modules.sort(key=lambda item: item["total"], reverse=True)
+    return {
+        "total": _startupProfile["total"],
+        "parallel": _startupProfile["parallel"],
+        "lazy": _startupProfile["lazy"],
+        "phases": dict(_startupProfile["phases"]),
+        "modules": modules,
+    }
+
+def _module_instance(meta_name):
+    # 未构造的延迟加载模块返回 None，避免在启动/停止时触发构造
+    instance = getattr(sdk, meta_name, None)
+    if isinstance(instance, LazyModule):
+        instance = instance._lazy_instance
+    return instance
+
+async def _call_hook(hook, timeout=None):
+    # start()/stop() 可以是普通函数或 async 函数，超时只对可等待的返回值生效
+    result = hook()
+    if inspect.isawaitable(result):
+        await asyncio.wait_for(result, timeout)
+
+async def _stop_instance(meta_name, instance, timeout):
+    try:
+        await _call_hook(instance.stop, timeout)
+        logger.debug(f"模块 {meta_name} 已停止")
+    except asyncio.TimeoutError:
+        logger.warning(f"模块 {meta_name} 停止超时（{timeout}s）")
+    except Exception as e:
+        logger.error(f"模块 {meta_name} 停止失败: {e}")
+
+def _schedule_start(module_name):
+    loop = _startLoop
+    if loop is None:
+        return
+    future = asyncio.run_coroutine_threadsafe(_start_module(module_name), loop)
+    _pendingStarts.add(future)
+    future.add_done_callback(_pendingStarts.discard)
+
+async def _start_module(module_name):
+    # 在事件循环中执行，等待依赖启动完成后再调用 start()；失败时只记录日志，不影响已运行的模块
+    meta_name = _meta_name(module_name)
+    instance = _module_instance(meta_name)
+    if meta_name in _startedModules or meta_name in _startingModules or not hasattr(instance, "start"):
+        return
+    starting = _startingModules[meta_name] = asyncio.get_running_loop().create_future()
+    try:
+        dependencies = [_meta_name(dep) for dep in _moduleGraph.dependencies(module_name)]
+        await asyncio.gather(*[_startingModules[dep] for dep in dependencies if dep in _startingModules])
+        await _call_hook(instance.start)
+        _startedModules.add(meta_name)
+        logger.debug(f"模块 {meta_name} 已启动")
+    except Exception as e:
+        logger.error(f"模块 {meta_name} 启动失败: {e}")
+    finally:
+        del _startingModules[meta_name]
+        starting.set_result(None)
+
+async def init_async(parallel=None, max_workers=None, lazy=None):
+    global _eventLoop, _startLoop
+    init(parallel, max_workers, lazy)
+    _eventLoop = asyncio.get_running_loop()
+    for level in _moduleLevels:
+        names = [meta_name for meta_name in level if hasattr(_module_instance(meta_name), "start")]
+        results = await asyncio.gather(
+            *[_call_hook(_module_instance(meta_name).start) for meta_name in names], return_exceptions=True
+        )
+        failed = None
+        for meta_name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"模块 {meta_name} 启动失败: {result}")
+                failed = failed or result
+            else:
+                _startedModules.add(meta_name)
+                logger.debug(f"模块 {meta_name} 已启动")
+        if failed is not None:
+            # 已启动的模块按逆序停止后再抛出异常
+            await shutdown()
+            raise failed
+    # start() 执行期间被访问而构造的延迟加载模块在这里补充启动，之后构造的模块由 register() 调度启动
+    _startLoop = _eventLoop
+    for module_name in _moduleGraph.order():
+        await _start_module(module_name)
+
+async def shutdown(timeout=10.0):
+    # 按依赖层级逆序调用 stop()，同一层并发执行；定义了 start() 但未启动的模块不会调用 stop()
+    global _eventLoop, _startLoop
+    unwatch_modules()
+    # 不再启动新构造的模块，并等待已调度的 start() 完成，使这些模块也能按顺序停止
+    _startLoop = None
+    while _pendingStarts:
+        await asyncio.gather(*[asyncio.wrap_future(future) for future in list(_pendingStarts)], return_exceptions=True)
+    # 先派发完已发布的事件，处理函数所属的模块此时仍在运行
+    await sdk.events.close(timeout)
+    for level in reversed(_moduleLevels):
+        stopping = []
+        for meta_name in level:
+            instance = _module_instance(meta_name)
+            if not hasattr(instance, "stop"):
+                continue
+            if hasattr(instance, "start") and meta_name not in _startedModules:
+                continue
+            stopping.append(_stop_instance(meta_name, instance, timeout))
+        await asyncio.gather(*stopping)
+    _startedModules.clear()
+    _eventLoop = None
+    # 模块停止后再关闭共享的 HTTP 会话，stop() 中仍可以发送请求
+    await sdk.http.close()
+    # 取消 util.runner 中未完成的任务，关闭共享线程池与进程池，下次使用时重新创建
+    util.runner.shutdown(wait=False)
+    util.pools.shutdown(wait=False)
+    env.flush()
+
+class _StagedSdk:
+    # reload() 构造新实例时传入的 sdk 视图：优先返回本次重新构造的实例，替换完成后清空，之后与 sdk 等价
+    def __init__(self, staged):
+        object.__setattr__(self, "_staged", staged)
+
+    def __getattr__(self, name):
+        if name in self._staged:
+            return self._staged[name]
+        return getattr(sdk, name)
+
+    def __setattr__(self, name, value):
+        setattr(sdk, name, value)
+
+def _meta_name(module_name, moduleInfos=None):
+    return (moduleInfos or _loadedModules)[module_name].get("meta", {}).get("name", None)
+
+def _resolve_module(name):
+    # name 可以是模块目录名，也可以是 moduleInfo 中的模块名称
+    if name in _loadedModules:
+        return name
+    for module_name in _loadedModules:
+        if _meta_name(module_name) == name:
+            return module_name
+    raise errors.InvalidModuleError(f"模块 {name} 未加载")
+
+def _dependents(module_name, graph):
+    # 返回 module_name 及所有直接或间接依赖它的模块，按依赖顺序排列
+    dependents = set(graph.all_dependents(module_name))
+    return [module_name] + [name for name in graph.order() if name in dependents]
+
+def _purge_module(module_name):
+    purged = {name: mod for name, mod in sys.modules.items() if name == module_name or name.startswith(module_name + ".")}
+    for name in purged:
+        del sys.modules[name]
+    return purged
+
+def _rebuild(module_name):
+    # 重新导入模块并构造它及已构造的依赖者的新实例，不修改 sdk；返回 (重建的模块名称, 旧实例, 新实例, 提交函数)
+    meta_name = _meta_name(module_name)
+    purged = _purge_module(module_name)
+    importlib.invalidate_caches()
+    try:
+        moduleObj = __import__(module_name)
+        moduleInfo, warning = validate_module(module_name, moduleObj)
+        if warning:
+            raise errors.InvalidModuleError(warning)
+        if moduleInfo.get("meta", {}).get("name", None) != meta_name:
+            raise errors.InvalidModuleError(f"模块 {module_name} 重新加载时不能修改模块名称 {meta_name}")
+
+        requires = list(moduleInfo.get("dependencies", {}).get("requires", []))
+        missing_required_deps = [dep for dep in requires if dep not in _moduleGraph]
+        if missing_required_deps:
+            raise errors.InvalidDependencyError(f"模块 {module_name} 缺少必需依赖: {missing_required_deps}")
+        optional_deps = moduleInfo.get("dependencies", {}).get("optional", [])
+        graph = _moduleGraph.copy()
+        graph.add(module_name, requires + [dep for dep in optional_deps if isinstance(dep, str) and dep in graph])
+        affected = _dependents(module_name, graph)
+
+        moduleInfos = dict(_loadedModules)
+        moduleInfos[module_name] = moduleInfo
+        # 未构造的延迟加载模块只替换模块对象，首次访问时使用新代码构造
+        rebuilt = [name for name in affected if _module_instance(_meta_name(name)) is not None]
+        oldInstances = {_meta_name(name): _module_instance(_meta_name(name)) for name in rebuilt}
+        staged = {}
+        view = _StagedSdk(staged)
+        for name in rebuilt:
+            moduleMain = (moduleObj if name == module_name else _moduleObjs[name]).Main(view)
+            setattr(moduleMain, "moduleInfo", moduleInfos[name])
+            staged[_meta_name(name, moduleInfos)] = moduleMain
+    except Exception:
+        _purge_module(module_name)
+        sys.modules.update(purged)
+        raise
+    newInstances = dict(staged)
+
+    def commit():
+        _moduleObjs[module_name] = moduleObj
+        if moduleInfo != _loadedModules[module_name]:
+            env.set_module(meta_name, {"status": True, "info": moduleInfo})
+        _loadedModules[module_name] = moduleInfo
+        _moduleGraph.add(module_name, graph.dependencies(module_name))
+        _moduleLevels[:] = [[_meta_name(name) for name in level] for level in _moduleGraph.levels()]
+        # 一次性更新 sdk 的属性字典，其他线程不会看到新旧实例混用的中间状态
+        sdk.__dict__.update(newInstances)
+        for name in rebuilt:
+            if name in _moduleProxies:
+                object.__setattr__(_moduleProxies[name], "_lazy_instance", newInstances[_meta_name(name)])
+        staged.clear()
+        logger.info(f"模块 {meta_name} 已重新加载，重新构造: {list(newInstances)}")
+
+    return list(newInstances), oldInstances, newInstances, commit
+
+def reload(name):
+    # 重新导入模块，按依赖顺序重新构造它及所有依赖它的模块，全部构造成功后一次性替换 sdk 上的实例
+    with _reloadLock:
+        module_name = _resolve_module(name)
+        affected = _dependents(module_name, _moduleGraph)
+        started = [_meta_name(name) for name in affected if _meta_name(name) in _startedModules]
+        if started:
+            raise RuntimeError(f"模块 {started} 已通过 init_async() 启动，请使用 await sdk.reload_async()")
+        try:
+            rebuilt, _, newInstances, commit = _rebuild(module_name)
+            commit()
+        except Exception as e:
+            logger.error(f"模块 {name} 重新加载失败: {e}")
+            raise
+    return newInstances.get(_meta_name(module_name))
+
+async def reload_async(name, timeout=10.0):
+    # 与 reload() 相同，已启动的模块先逆序调用旧实例的 stop()，替换后再依次调用新实例的 start()
+    with _reloadLock:
+        module_name = _resolve_module(name)
+        try:
+            rebuilt, oldInstances, newInstances, commit = _rebuild(module_name)
+        except Exception as e:
+            logger.error(f"模块 {name} 重新加载失败: {e}")
+            raise
+    started = [meta_name for meta_name in rebuilt if meta_name in _startedModules]
+    for meta_name in reversed(started):
+        if hasattr(oldInstances[meta_name], "stop"):
+            await _stop_instance(meta_name, oldInstances[meta_name], timeout)
+        _startedModules.discard(meta_name)
+    with _reloadLock:
+        commit()
+    for meta_name in started:
+        if hasattr(newInstances[meta_name], "start"):
+            try:
+                await _call_hook(newInstances[meta_name].start)
+            except Exception as e:
+                logger.error(f"模块 {meta_name} 启动失败: {e}")
+                raise
+        _startedModules.add(meta_name)
+    return newInstances.get(_meta_name(module_name))
+
+def watch_modules(interval=1.0):
+    # 后台轮询已加载模块目录，内容变化时自动重新加载；通过 init_async() 启动时在其事件循环中执行 reload_async()
+    global _moduleWatcher
+    if _moduleWatcher is not None and _moduleWatcher.is_alive():
+        return
+    _moduleWatchStop.clear()
+    _moduleWatcher = threading.Thread(
+        target=_watch_modules_loop, args=(interval,), name="ErisPulse-module-watch", daemon=True
+    )
+    _moduleWatcher.start()
+
+def unwatch_modules():
+    _moduleWatchStop.set()
+
+def _watch_modules_loop(interval):
+    known = {}
+    for module_name in list(_loadedModules):
+        path = os.path.join(sdkModulePath, module_name)
+        known[module_name] = (module_signature(path), module_digest(path))
+    while not _moduleWatchStop.wait(interval):
+        for module_name in list(_loadedModules):
+            path = os.path.join(sdkModulePath, module_name)
+            try:
+                signature = module_signature(path)
+                if known.get(module_name, (None,))[0] == signature:
+                    continue
+                digest = module_digest(path)
+            except OSError:
+                continue
+            previous = known.get(module_name)
+            known[module_name] = (signature, digest)
+            # 只有 mtime 变化、内容一致时不重新加载
+            if previous is not None and previous[1] == digest:
+                continue
+            logger.info(f"检测到模块 {module_name} 已修改，正在重新加载")
+            try:
+                loop = _eventLoop
+                if loop is not None and loop.is_running():
+                    asyncio.run_coroutine_threadsafe(reload_async(module_name), loop).result()
+                else:
+                    reload(module_name)
+            except Exception:
+                # reload() 已记录错误，旧实例保持不变
+                continue
 
 sdk.init = init
+sdk.init_async = init_async
+sdk.shutdown = shutdown
+sdk.startup_report = startup_report
+sdk.run_io = util.pools.run_io
+sdk.run_cpu = util.pools.run_cpu
+sdk.pool_stats = util.pools.stats
+sdk.reload = reload
+sdk.reload_async = reload_async
+sdk.watch_modules = watch_modules
+sdk.unwatch_modules = unwatch_modules
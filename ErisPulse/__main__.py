@@ -2,10 +2,8 @@ import argparse
 import os
 import sys
 import shutil
-import aiohttp
 import zipfile
 import fnmatch
-import asyncio
 import subprocess
 import json
 from rich.console import Console
@@ -17,8 +15,19 @@ from prompt_toolkit import PromptSession
 from prompt_toolkit.completion import WordCompleter
 from prompt_toolkit.formatted_text import HTML
 from .envManager import env
+from .util import DependencyGraph, runner
+from . import sdk
 
 console = Console()
+
+def run_async(coro):
+    # 所有网络请求在 util.runner 的后台事件循环中执行，多次请求共用 sdk.http 的连接池与 DNS 缓存
+    return runner.run(coro)
+
+def close_http():
+    if sdk.http.stats()["open_sessions"]:
+        run_async(sdk.http.close())
+
 class SourceManager:
     def __init__(self):
         self._init_sources()
@@ -38,18 +47,17 @@ class SourceManager:
             url = f"{url}/map.json"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    if response.headers.get('Content-Type', '').startswith('application/json'):
-                        return url
-                    else:
-                        console.print(Panel(
-                            f"[red]源 {url} 返回的内容不是有效的 JSON 格式[/red]",
-                            title="错误",
-                            border_style="red"
-                        ))
-                        return None
+            async with sdk.http.get(url) as response:
+                response.raise_for_status()
+                if response.headers.get('Content-Type', '').startswith('application/json'):
+                    return url
+                else:
+                    console.print(Panel(
+                        f"[red]源 {url} 返回的内容不是有效的 JSON 格式[/red]",
+                        title="错误",
+                        border_style="red"
+                    ))
+                    return None
         except Exception as e:
             console.print(Panel(
                 f"[red]访问源 {url} 失败: {e}[/red]",
@@ -59,7 +67,7 @@ class SourceManager:
             return None
 
     def add_source(self, value):
-        validated_url = asyncio.run(self._validate_url(value))
+        validated_url = run_async(self._validate_url(value))
         if not validated_url:
             console.print(Panel(
                 "[red]提供的源不是一个有效源，请检查后重试[/red]",
@@ -101,48 +109,49 @@ class SourceManager:
         table.add_column("地址", style="blue")
 
         async def fetch_source_data():
-            async with aiohttp.ClientSession() as session:
-                for origin in origins:
-                    console.print(f"[cyan]正在获取 {origin}...[/cyan]")
-                    try:
-                        async with session.get(origin) as response:
-                            response.raise_for_status()
-                            if response.headers.get('Content-Type', '').startswith('application/json'):
-                                content = await response.json()
-                                providers[content["name"]] = content["base"]
-                                
-                                for module in content["modules"].keys():
-                                    module_content = content["modules"][module]
-                                    modules[f'{module}@{content["name"]}'] = module_content
-                                    module_origin_name = module_content["path"]
-                                    module_alias_name = module
-                                    module_alias[f'{module_origin_name}@{content["name"]}'] = module_alias_name
-
-                                    table.add_row(
-                                        content['name'],
-                                        module,
-                                        f"{providers[content['name']]}{module_origin_name}"
-                                    )
-                            else:
-                                console.print(Panel(
-                                    f"[red]源 {origin} 返回的内容不是有效的 JSON 格式[/red]",
-                                    title="错误",
-                                    border_style="red"
-                                ))
-                    except Exception as e:
-                        console.print(Panel(
-                            f"[red]获取 {origin} 时出错: {e}[/red]",
-                            title="错误",
-                            border_style="red"
-                        ))
+            for origin in origins:
+                console.print(f"[cyan]正在获取 {origin}...[/cyan]")
+                try:
+                    async with sdk.http.get(origin) as response:
+                        response.raise_for_status()
+                        if response.headers.get('Content-Type', '').startswith('application/json'):
+                            content = await response.json()
+                            providers[content["name"]] = content["base"]
+                            
+                            for module in content["modules"].keys():
+                                module_content = content["modules"][module]
+                                modules[f'{module}@{content["name"]}'] = module_content
+                                module_origin_name = module_content["path"]
+                                module_alias_name = module
+                                module_alias[f'{module_origin_name}@{content["name"]}'] = module_alias_name
+
+                                table.add_row(
+                                    content['name'],
+                                    module,
+                                    f"{providers[content['name']]}{module_origin_name}"
+                                )
+                        else:
+                            console.print(Panel(
+                                f"[red]源 {origin} 返回的内容不是有效的 JSON 格式[/red]",
+                                title="错误",
+                                border_style="red"
+                            ))
+                except Exception as e:
+                    console.print(Panel(
+                        f"[red]获取 {origin} 时出错: {e}[/red]",
+                        title="错误",
+                        border_style="red"
+                    ))
 
-        asyncio.run(fetch_source_data())
+        run_async(fetch_source_data())
         console.print(table)
         from datetime import datetime
-        env.set('providers', providers)
-        env.set('modules', modules)
-        env.set('module_alias', module_alias)
-        env.set('last_origin_update_time', datetime.now().isoformat())
+        env.set_many({
+            'providers': providers,
+            'modules': modules,
+            'module_alias': module_alias,
+            'last_origin_update_time': datetime.now().isoformat()
+        })
         
         console.print(Panel(
             "[green]源更新完成[/green]",
@@ -214,9 +223,10 @@ def disable_module(module_name):
             border_style="red"
         ))
 
-async def fetch_url(session, url):
+async def fetch_url(url):
     try:
-        async with session.get(url) as response:
+        # 模块压缩包可能较大，不使用 HTTP_TIMEOUT 的总超时
+        async with sdk.http.get(url, timeout=sdk.http.download_timeout()) as response:
             response.raise_for_status()
             return await response.read()
     except Exception as e:
@@ -228,38 +238,37 @@ def extract_and_setup_module(module_name, module_url, zip_path, module_dir):
         console.print(f"[cyan]正在从 {module_url} 下载模块...[/cyan]")
         
         async def download_module():
-            async with aiohttp.ClientSession() as session:
-                content = await fetch_url(session, module_url)
-                if content is None:
-                    return False
-                
-                with open(zip_path, 'wb') as zip_file:
-                    zip_file.write(content)
-
-                if not os.path.exists(module_dir):
-                    os.makedirs(module_dir)
-
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(module_dir)
-                
-                init_file_path = os.path.join(module_dir, '__init__.py')
-                if not os.path.exists(init_file_path):
-                    sub_module_dir = os.path.join(module_dir, module_name)
-                    m_sub_module_dir = os.path.join(module_dir, f"m_{module_name}")
-                    for sub_dir in [sub_module_dir, m_sub_module_dir]:
-                        if os.path.exists(sub_dir) and os.path.isdir(sub_dir):
-                            for item in os.listdir(sub_dir):
-                                source_item = os.path.join(sub_dir, item)
-                                target_item = os.path.join(module_dir, item)
-                                if os.path.exists(target_item):
-                                    os.remove(target_item)
-                                shutil.move(source_item, module_dir)
-                            os.rmdir(sub_dir)
-
-                console.print(f"[green]模块 {module_name} 文件已成功解压并设置[/green]")
-                return True
+            content = await fetch_url(module_url)
+            if content is None:
+                return False
+            
+            with open(zip_path, 'wb') as zip_file:
+                zip_file.write(content)
+
+            if not os.path.exists(module_dir):
+                os.makedirs(module_dir)
+
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                zip_ref.extractall(module_dir)
+            
+            init_file_path = os.path.join(module_dir, '__init__.py')
+            if not os.path.exists(init_file_path):
+                sub_module_dir = os.path.join(module_dir, module_name)
+                m_sub_module_dir = os.path.join(module_dir, f"m_{module_name}")
+                for sub_dir in [sub_module_dir, m_sub_module_dir]:
+                    if os.path.exists(sub_dir) and os.path.isdir(sub_dir):
+                        for item in os.listdir(sub_dir):
+                            source_item = os.path.join(sub_dir, item)
+                            target_item = os.path.join(module_dir, item)
+                            if os.path.exists(target_item):
+                                os.remove(target_item)
+                            shutil.move(source_item, module_dir)
+                        os.rmdir(sub_dir)
+
+            console.print(f"[green]模块 {module_name} 文件已成功解压并设置[/green]")
+            return True
         
-        return asyncio.run(download_module())
+        return run_async(download_module())
 
     except Exception as e:
         console.print(Panel(f"[red]处理模块 {module_name} 文件失败: {e}[/red]", title="错误", border_style="red"))
@@ -469,6 +478,24 @@ def uninstall_module(module_name):
         title="模块信息",
         border_style="green"
     ))
+
+    # 检查哪些已注册模块（直接或间接）依赖此模块
+    all_modules = env.get_all_modules()
+    dependency_graph = DependencyGraph({
+        name: info.get('info', {}).get('dependencies', {}).get('requires', [])
+        for name, info in all_modules.items()
+    })
+    dependents = dependency_graph.all_dependents(module_name)
+    if dependents:
+        direct_dependents = dependency_graph.dependents(module_name)
+        indirect_dependents = [name for name in dependents if name not in direct_dependents]
+        console.print(Panel(
+            f"[yellow]直接依赖: {', '.join(direct_dependents)}[/yellow]\n"
+            f"[yellow]间接依赖: {', '.join(indirect_dependents) or '无'}[/yellow]\n"
+            f"[red]卸载后以上模块将无法加载[/red]",
+            title="依赖警告",
+            border_style="yellow"
+        ))
     
     if not Confirm.ask("[red]确认要卸载此模块吗？[/red]", default=False):
         console.print("[yellow]卸载已取消[/yellow]")
@@ -508,7 +535,6 @@ def uninstall_module(module_name):
 
     pip_dependencies = depsinfo.get('pip', [])
     if pip_dependencies:
-        all_modules = env.get_all_modules()
         unused_pip_dependencies = []
         
         essential_packages = {'aiohttp', 'rich'}
@@ -731,6 +757,71 @@ def list_modules(module_name=None):
         border_style="blue"
     ))
 
+def profile_startup(top=None, output=None, parallel=False, lazy=False, as_json=False):
+    from . import init as init_module, startup_report
+    profiler = None
+    if output:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        init_module(parallel=parallel, lazy=lazy)
+    except Exception as e:
+        console.print(Panel(f"[red]初始化失败: {e}[/red]", title="错误", border_style="red"))
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(output)
+
+    report = startup_report()
+    if as_json:
+        console.print_json(json.dumps(report, ensure_ascii=False))
+        return
+
+    def ms(value):
+        return "-" if value is None else f"{value * 1000:.1f}"
+
+    table = Table(
+        title="模块启动耗时 (ms)",
+        show_header=True,
+        header_style="bold magenta",
+        expand=True,
+        box=box.ROUNDED
+    )
+    table.add_column("模块名称", style="cyan", min_width=20)
+    table.add_column("状态", style="green", justify="center")
+    table.add_column("发现", justify="right")
+    table.add_column("导入", justify="right")
+    table.add_column("依赖解析", justify="right")
+    table.add_column("构造", justify="right")
+    table.add_column("合计", style="bold yellow", justify="right")
+
+    for item in report["modules"][:top]:
+        status = item["status"] + (" (缓存)" if item["cached"] else "")
+        table.add_row(
+            f"[bold]{item['name'] or item['module']}[/bold]",
+            status,
+            ms(item["discovery"]),
+            ms(item["import"]),
+            ms(item["resolve"]),
+            ms(item["construct"]),
+            ms(item["total"])
+        )
+    console.print(table)
+
+    phase_names = {"discovery": "发现", "import": "导入", "dependencies": "依赖解析", "db_sync": "数据库同步", "construct": "构造"}
+    phases = "  ".join(f"{label}: {ms(report['phases'].get(key))}" for key, label in phase_names.items())
+    mode = "并行" if report["parallel"] else "串行"
+    if report["lazy"]:
+        mode += " + 延迟加载"
+    console.print(Panel(
+        f"{phases}\n[bold]总耗时: {ms(report['total'])} ms[/bold]（{mode}）",
+        title="阶段耗时 (ms)",
+        border_style="blue"
+    ))
+    if output:
+        console.print(f"[green]cProfile 数据已写入 {output}，可使用 snakeviz / flameprof 等工具查看火焰图[/green]")
+
 def main():
     parser = argparse.ArgumentParser(
         description="ErisPulse 命令行工具",
@@ -774,6 +865,13 @@ def main():
     del_origin_parser = origin_subparsers.add_parser('del', help='删除模块源')
     del_origin_parser.add_argument('url', type=str, help='要删除的模块源URL')
 
+    profile_parser = subparsers.add_parser('profile-startup', help='分析模块启动耗时')
+    profile_parser.add_argument('--top', type=int, help='只显示耗时最多的前 N 个模块')
+    profile_parser.add_argument('--output', '-o', type=str, help='将 cProfile 数据写入指定文件（.prof）')
+    profile_parser.add_argument('--parallel', action='store_true', help='使用并行初始化模式')
+    profile_parser.add_argument('--lazy', action='store_true', help='使用延迟加载模式')
+    profile_parser.add_argument('--json', action='store_true', help='以 JSON 格式输出报告')
+
     args = parser.parse_args()
     source_manager = SourceManager()
 
@@ -924,8 +1022,11 @@ def main():
             source_manager.del_source(args.url)
         else:
             origin_parser.print_help()
+    elif args.command == 'profile-startup':
+        profile_startup(args.top, args.output, args.parallel, args.lazy, args.json)
     else:
         parser.print_help()
+    close_http()
 
 if __name__ == "__main__":
     main()
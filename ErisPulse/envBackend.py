@@ -0,0 +1,914 @@
+import os
+import json
+import dbm
+import atexit
+import sqlite3
+import threading
+import time
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import deque
+from contextlib import contextmanager
+
+_MISSING = object()
+
+_SCHEMA_VERSION = 2
+
+_SET_SQL = "INSERT OR REPLACE INTO config (key, type, value, expires_at) VALUES (?, ?, ?, ?)"
+
+_SET_STORAGE_SQL = "INSERT OR REPLACE INTO storage (namespace, key, type, value) VALUES (?, ?, ?, ?)"
+
+_SET_MODULE_SQL = """
+INSERT OR REPLACE INTO modules (
+    module_name, status, version, description, author,
+    dependencies, optional_dependencies, pip_dependencies
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# 已过期的行视为不存在：从 delta 重新计数并使用新的过期时间
+_INCR_SQL = """
+INSERT INTO config (key, type, value, expires_at) VALUES (:key, :type, :delta, :expires_at)
+ON CONFLICT(key) DO UPDATE SET
+    value = CASE WHEN config.expires_at <= :now THEN excluded.value
+                 ELSE config.value + excluded.value END,
+    type = CASE WHEN config.expires_at <= :now THEN excluded.type
+                WHEN config.type = 'f' OR excluded.type = 'f' THEN 'f' ELSE 'i' END,
+    expires_at = CASE WHEN config.expires_at <= :now THEN excluded.expires_at
+                      ELSE config.expires_at END
+WHERE config.type IN ('i', 'f') OR config.expires_at <= :now
+"""
+
+# 存储后端只处理已序列化的行：
+#   配置行 (type, value, expires_at)，value 为 str/int/float/bytes/None
+#   模块行 (module_name, status, version, description, author, dependencies, optional_dependencies, pip_dependencies)
+#   命名空间行 (key, type, value)
+# 类型标记的含义、缓存与写入策略由 EnvManager 负责
+
+def _prefix_end(prefix):
+    # 前缀区间的上界（不含），空前缀表示不限
+    if not prefix:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _key_range(prefix, start, end):
+    # 合并前缀与 [start, end) 区间，返回 (下界, 上界)，上界为 None 表示不限
+    lower = prefix if start is None or start < prefix else start
+    upper = _prefix_end(prefix)
+    if end is not None and (upper is None or end < upper):
+        upper = end
+    return lower, upper
+
+
+class BaseBackend:
+    name = None
+    # 是否能发现其他进程的写入
+    shared = False
+
+    def __init__(self, path=None):
+        self.path = path
+        self.on_commit = None
+
+    def _committed(self):
+        if self.on_commit is not None:
+            self.on_commit()
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def transaction(self):
+        raise NotImplementedError
+
+    def in_transaction(self):
+        raise NotImplementedError
+
+    @contextmanager
+    def durable(self):
+        yield
+
+    def data_version(self):
+        # 其他进程提交后变化的版本号，不支持跨进程的后端返回常量
+        return 0
+
+    def get_row(self, key):
+        return self.get_rows([key]).get(key)
+
+    def get_rows(self, keys):
+        raise NotImplementedError
+
+    def put_rows(self, rows):
+        raise NotImplementedError
+
+    def delete_rows(self, keys):
+        raise NotImplementedError
+
+    def incr(self, key, type_, delta, expires_at, now):
+        raise NotImplementedError
+
+    def incr_many(self, rows, now):
+        with self.transaction():
+            for key, type_, delta, expires_at in rows:
+                self.incr(key, type_, delta, expires_at, now)
+
+    def clear(self):
+        raise NotImplementedError
+
+    def scan(self, prefix="", after=None, limit=None):
+        raise NotImplementedError
+
+    def purge_expired(self, now, limit):
+        raise NotImplementedError
+
+    def get_meta(self, key, default=None):
+        raise NotImplementedError
+
+    def set_meta(self, key, value):
+        raise NotImplementedError
+
+    def storage_get(self, namespace, key):
+        raise NotImplementedError
+
+    def storage_put(self, namespace, rows):
+        raise NotImplementedError
+
+    def storage_delete(self, namespace, keys):
+        raise NotImplementedError
+
+    def storage_scan(self, namespace, prefix="", start=None, end=None, after=None, limit=None):
+        raise NotImplementedError
+
+    def storage_clear(self, namespace):
+        raise NotImplementedError
+
+    def module_rows(self, module_name=None):
+        raise NotImplementedError
+
+    def put_modules(self, rows):
+        raise NotImplementedError
+
+    def set_module_status(self, module_name, status):
+        raise NotImplementedError
+
+    def remove_module(self, module_name):
+        raise NotImplementedError
+
+    def last_change_seq(self):
+        raise NotImplementedError
+
+    def changes_since(self, seq):
+        raise NotImplementedError
+
+    def prune_changes(self, before):
+        pass
+
+
+class _ConnectionHolder:
+    # 保存在线程局部变量中，线程退出后被回收，由 weakref.finalize 关闭该线程的连接
+    __slots__ = ("finalizer", "__weakref__")
+
+
+def _close_connection(connections, lock, conn):
+    with lock:
+        connections.discard(conn)
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+
+
+class SQLiteBackend(BaseBackend):
+    name = "sqlite"
+    shared = True
+    busy_timeout = 5000
+    # changes 表最多保留的行数，与 MemoryBackend 一致
+    max_changes = 10000
+
+    def __init__(self, path):
+        super().__init__(path)
+        self._local = threading.local()
+        self._connections = set()
+        self._conn_lock = threading.Lock()
+
+    def _get_conn(self):
+        # 每个线程持有一个长连接，线程退出时关闭，fork 后重新连接
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is not None:
+            if local.pid == os.getpid():
+                return conn
+            # 父进程的连接不能在子进程中关闭，只解除关联
+            local.holder.finalizer.detach()
+            with self._conn_lock:
+                self._connections.discard(conn)
+
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout / 1000,
+            check_same_thread=False,
+            cached_statements=256
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout)}")
+        local.conn = conn
+        local.pid = os.getpid()
+        local.tx_depth = 0
+        holder = local.holder = _ConnectionHolder()
+        holder.finalizer = weakref.finalize(holder, _close_connection, self._connections, self._conn_lock, conn)
+        holder.finalizer.atexit = False
+        with self._conn_lock:
+            self._connections.add(conn)
+        return conn
+
+    def open(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._init_db()
+
+    def close(self):
+        with self._conn_lock:
+            connections, self._connections = self._connections, set()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+    @contextmanager
+    def _writing(self):
+        # 处于 transaction() 中时由事务统一提交，否则每次写入单独提交
+        conn = self._get_conn()
+        if self._local.tx_depth:
+            yield conn
+        else:
+            with conn:
+                yield conn
+            self._committed()
+
+    @contextmanager
+    def transaction(self):
+        conn = self._get_conn()
+        local = self._local
+        if local.tx_depth:
+            local.tx_depth += 1
+            try:
+                yield
+            finally:
+                local.tx_depth -= 1
+            return
+
+        local.tx_depth = 1
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            yield
+            conn.commit()
+            self._committed()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            local.tx_depth = 0
+
+    def in_transaction(self):
+        self._get_conn()
+        return bool(self._local.tx_depth)
+
+    @contextmanager
+    def durable(self):
+        conn = self._get_conn()
+        if self._local.tx_depth:
+            yield
+            return
+        conn.execute("PRAGMA synchronous=FULL")
+        try:
+            yield
+        finally:
+            conn.execute("PRAGMA synchronous=NORMAL")
+
+    def data_version(self):
+        # data_version 仅在其他连接（含其他进程）提交后变化
+        return self._get_conn().execute("PRAGMA data_version").fetchone()[0]
+
+    def _init_db(self):
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS config (
+            key TEXT PRIMARY KEY,
+            type TEXT,
+            value BLOB,
+            expires_at REAL
+        )
+        """)
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS modules (
+            module_name TEXT PRIMARY KEY,
+            status INTEGER NOT NULL,
+            version TEXT,
+            description TEXT,
+            author TEXT,
+            dependencies TEXT,
+            optional_dependencies TEXT,
+            pip_dependencies TEXT
+        )
+        """)
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+        """)
+        # 各模块独立的命名空间存储，(namespace, key) 主键即范围扫描所用的索引
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS storage (
+            namespace TEXT NOT NULL,
+            key TEXT NOT NULL,
+            type TEXT,
+            value BLOB,
+            PRIMARY KEY (namespace, key)
+        ) WITHOUT ROWID
+        """)
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS changes (
+            seq INTEGER PRIMARY KEY,
+            kind TEXT NOT NULL,
+            key TEXT NOT NULL,
+            changed_at REAL NOT NULL
+        )
+        """)
+        conn.commit()
+
+        if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+            self._migrate_db()
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_config_expires_at
+        ON config (expires_at) WHERE expires_at IS NOT NULL
+        """)
+        # 由触发器记录变更序列，其他进程（包括旧版本）的写入同样会被记录
+        for table, kind, column in (("config", "c", "key"), ("modules", "m", "module_name")):
+            for event, row in (("INSERT", "NEW"), ("UPDATE", "NEW"), ("DELETE", "OLD")):
+                cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_{event.lower()}_changes AFTER {event} ON {table}
+                BEGIN
+                    INSERT INTO changes (kind, key, changed_at)
+                    VALUES ('{kind}', {row}.{column}, (julianday('now') - 2440587.5) * 86400.0);
+                END
+                """)
+        conn.commit()
+
+    def _migrate_db(self):
+        from .envManager import EnvManager
+
+        with self.transaction():
+            conn = self._get_conn()
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+                return
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(config)")]
+            if "type" not in columns:
+                # 旧版 config 表只有 TEXT 类型的 value 列，重建为带类型标记的格式
+                rows = conn.execute("SELECT key, value FROM config").fetchall()
+                conn.execute("ALTER TABLE config RENAME TO config_legacy")
+                conn.execute("""
+                CREATE TABLE config (
+                    key TEXT PRIMARY KEY,
+                    type TEXT,
+                    value BLOB,
+                    expires_at REAL
+                )
+                """)
+                conn.executemany(
+                    "INSERT INTO config (key, type, value) VALUES (?, ?, ?)",
+                    [(key, *EnvManager._serialize(EnvManager._deserialize(None, value))) for key, value in rows]
+                )
+                conn.execute("DROP TABLE config_legacy")
+            elif "expires_at" not in columns:
+                conn.execute("ALTER TABLE config ADD COLUMN expires_at REAL")
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def get_row(self, key):
+        try:
+            return self._get_conn().execute(
+                "SELECT type, value, expires_at FROM config WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.OperationalError as e:
+            if "no such table" in str(e):
+                self._init_db()
+                return self.get_row(key)
+            else:
+                raise
+
+    def get_rows(self, keys):
+        # 分批查询，避免超出 SQLite 单条语句的参数上限
+        conn = self._get_conn()
+        found = {}
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for key, type_, value, expires_at in conn.execute(
+                f"SELECT key, type, value, expires_at FROM config WHERE key IN ({placeholders})", chunk
+            ):
+                found[key] = (type_, value, expires_at)
+        return found
+
+    def put_rows(self, rows):
+        with self._writing() as conn:
+            conn.executemany(_SET_SQL, rows)
+
+    def delete_rows(self, keys):
+        with self._writing() as conn:
+            conn.executemany("DELETE FROM config WHERE key = ?", [(key,) for key in keys])
+
+    def _incr_params(self, key, type_, delta, expires_at, now):
+        return {"key": key, "type": type_, "delta": delta, "expires_at": expires_at, "now": now}
+
+    def incr(self, key, type_, delta, expires_at, now):
+        with self._writing() as conn:
+            conn.execute(_INCR_SQL, self._incr_params(key, type_, delta, expires_at, now))
+            return conn.execute("SELECT type, value FROM config WHERE key = ?", (key,)).fetchone()
+
+    def incr_many(self, rows, now):
+        with self._writing() as conn:
+            conn.executemany(_INCR_SQL, [self._incr_params(*row, now) for row in rows])
+
+    def clear(self):
+        with self._writing() as conn:
+            conn.execute("DELETE FROM config")
+
+    def scan(self, prefix="", after=None, limit=None):
+        sql = "SELECT key, type, value, expires_at FROM config WHERE key >= ?"
+        params = [prefix]
+        end = _prefix_end(prefix)
+        if end is not None:
+            sql += " AND key < ?"
+            params.append(end)
+        if after is not None:
+            sql += " AND key > ?"
+            params.append(after)
+        sql += " ORDER BY key"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return self._get_conn().execute(sql, params).fetchall()
+
+    def purge_expired(self, now, limit):
+        with self._writing() as conn:
+            cursor = conn.execute(
+                "DELETE FROM config WHERE rowid IN ("
+                "SELECT rowid FROM config WHERE expires_at <= ? LIMIT ?)",
+                (now, limit)
+            )
+        return cursor.rowcount
+
+    def storage_get(self, namespace, key):
+        return self._get_conn().execute(
+            "SELECT type, value FROM storage WHERE namespace = ? AND key = ?", (namespace, key)
+        ).fetchone()
+
+    def storage_put(self, namespace, rows):
+        with self._writing() as conn:
+            conn.executemany(_SET_STORAGE_SQL, [(namespace, *row) for row in rows])
+
+    def storage_delete(self, namespace, keys):
+        with self._writing() as conn:
+            conn.executemany(
+                "DELETE FROM storage WHERE namespace = ? AND key = ?", [(namespace, key) for key in keys]
+            )
+
+    def storage_scan(self, namespace, prefix="", start=None, end=None, after=None, limit=None):
+        lower, upper = _key_range(prefix, start, end)
+        sql = "SELECT key, type, value FROM storage WHERE namespace = ? AND key >= ?"
+        params = [namespace, lower]
+        if upper is not None:
+            sql += " AND key < ?"
+            params.append(upper)
+        if after is not None:
+            sql += " AND key > ?"
+            params.append(after)
+        sql += " ORDER BY key"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return self._get_conn().execute(sql, params).fetchall()
+
+    def storage_clear(self, namespace):
+        with self._writing() as conn:
+            return conn.execute("DELETE FROM storage WHERE namespace = ?", (namespace,)).rowcount
+
+    def get_meta(self, key, default=None):
+        row = self._get_conn().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value):
+        with self._writing() as conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def module_rows(self, module_name=None):
+        conn = self._get_conn()
+        if module_name is None:
+            return conn.execute("SELECT * FROM modules").fetchall()
+        return conn.execute("SELECT * FROM modules WHERE module_name = ?", (module_name,)).fetchall()
+
+    def put_modules(self, rows):
+        with self._writing() as conn:
+            conn.executemany(_SET_MODULE_SQL, rows)
+
+    def set_module_status(self, module_name, status):
+        with self._writing() as conn:
+            conn.execute("UPDATE modules SET status = ? WHERE module_name = ?", (status, module_name))
+
+    def remove_module(self, module_name):
+        with self._writing() as conn:
+            cursor = conn.execute("DELETE FROM modules WHERE module_name = ?", (module_name,))
+            return cursor.rowcount > 0
+
+    def last_change_seq(self):
+        return self._get_conn().execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
+
+    def changes_since(self, seq):
+        return self._get_conn().execute(
+            "SELECT seq, kind, key FROM changes WHERE seq > ? ORDER BY seq", (seq,)
+        ).fetchall()
+
+    def prune_changes(self, before):
+        # 删除早于 before 或超出 max_changes 的行；始终保留最大序号的行，保证新分配的序号单调递增
+        with self._writing() as conn:
+            conn.execute(
+                """
+                DELETE FROM changes WHERE seq < (SELECT MAX(seq) FROM changes)
+                AND (changed_at < ? OR seq <= (SELECT MAX(seq) FROM changes) - ?)
+                """,
+                (before, self.max_changes)
+            )
+
+
+class MemoryBackend(BaseBackend):
+    # 仅存在于当前进程，适用于测试、基准测试与无需持久化的场景
+    name = "memory"
+    max_changes = 10000
+
+    def __init__(self, path=None):
+        super().__init__(path)
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._seq = 0
+        self._changes = deque(maxlen=self.max_changes)
+        self._config = {}
+        self._meta = {}
+        self._modules = {}
+        # 命名空间存储以 "namespace\0key" 为键，另按命名空间维护有序键列表用于范围扫描
+        self._storage = {}
+        self._storage_index = {}
+
+    @contextmanager
+    def transaction(self):
+        # 事务期间持有全局锁，其他线程的读写等待提交；回滚时按撤销日志恢复
+        with self._lock:
+            local = self._local
+            if getattr(local, "undo", None) is not None:
+                yield
+                return
+            local.undo = []
+            seq = self._seq
+            try:
+                yield
+            except BaseException:
+                for store, key, old in reversed(local.undo):
+                    if old is _MISSING:
+                        store.pop(key, None)
+                    else:
+                        store[key] = old
+                while self._changes and self._changes[-1][0] > seq:
+                    self._changes.pop()
+                self._seq = seq
+                self._storage_index.clear()
+                raise
+            finally:
+                local.undo = None
+        self._committed()
+
+    def in_transaction(self):
+        return getattr(self._local, "undo", None) is not None
+
+    @contextmanager
+    def _writing(self):
+        with self._lock:
+            if self.in_transaction():
+                yield
+                return
+            yield
+        self._committed()
+
+    def _put(self, store, kind, key, value):
+        undo = getattr(self._local, "undo", None)
+        if undo is not None:
+            undo.append((store, key, store.get(key, _MISSING)))
+        store[key] = value
+        if kind:
+            self._record(kind, key)
+
+    def _pop(self, store, kind, key):
+        old = store.pop(key, _MISSING)
+        if old is _MISSING:
+            return False
+        undo = getattr(self._local, "undo", None)
+        if undo is not None:
+            undo.append((store, key, old))
+        if kind:
+            self._record(kind, key)
+        return True
+
+    def _record(self, kind, key):
+        self._seq += 1
+        self._changes.append((self._seq, kind, key, time.time()))
+
+    def get_row(self, key):
+        with self._lock:
+            return self._config.get(key)
+
+    def get_rows(self, keys):
+        with self._lock:
+            found = {}
+            for key in keys:
+                row = self._config.get(key)
+                if row is not None:
+                    found[key] = row
+            return found
+
+    def put_rows(self, rows):
+        with self._writing():
+            for key, type_, value, expires_at in rows:
+                self._put(self._config, "c", key, (type_, value, expires_at))
+
+    def delete_rows(self, keys):
+        with self._writing():
+            for key in keys:
+                self._pop(self._config, "c", key)
+
+    def incr(self, key, type_, delta, expires_at, now):
+        # 与 SQLite 后端的 _INCR_SQL 语义一致
+        with self._writing():
+            row = self._config.get(key)
+            if row is None or (row[2] is not None and row[2] <= now):
+                row = (type_, delta, expires_at)
+            elif row[0] in ("i", "f"):
+                value = (float(row[1]) if row[0] == "f" else int(row[1])) + delta
+                row = ("f" if "f" in (row[0], type_) else "i", value, row[2])
+            else:
+                return row[:2]
+            self._put(self._config, "c", key, row)
+            return row[:2]
+
+    def clear(self):
+        with self._writing():
+            for key in list(self._config):
+                self._pop(self._config, "c", key)
+
+    def scan(self, prefix="", after=None, limit=None):
+        with self._lock:
+            keys = sorted(
+                key for key in self._config
+                if key.startswith(prefix) and (after is None or key > after)
+            )
+            if limit is not None:
+                keys = keys[:int(limit)]
+            return [(key, *self._config.get(key)) for key in keys]
+
+    def purge_expired(self, now, limit):
+        with self._writing():
+            expired = []
+            for key, (_, _, expires_at) in self._config.items():
+                if expires_at is not None and expires_at <= now:
+                    expired.append(key)
+                    if len(expired) >= limit:
+                        break
+            for key in expired:
+                self._pop(self._config, "c", key)
+        return len(expired)
+
+    def _storage_keys(self, namespace):
+        keys = self._storage_index.get(namespace)
+        if keys is None:
+            prefix = namespace + "\0"
+            keys = sorted(name[len(prefix):] for name in self._storage if name.startswith(prefix))
+            self._storage_index[namespace] = keys
+        return keys
+
+    def storage_get(self, namespace, key):
+        with self._lock:
+            return self._storage.get(f"{namespace}\0{key}")
+
+    def storage_put(self, namespace, rows):
+        with self._writing():
+            keys = self._storage_keys(namespace)
+            for key, type_, value in rows:
+                name = f"{namespace}\0{key}"
+                if name not in self._storage:
+                    keys.insert(bisect_left(keys, key), key)
+                self._put(self._storage, None, name, (type_, value))
+
+    def storage_delete(self, namespace, keys):
+        with self._writing():
+            index = self._storage_keys(namespace)
+            for key in keys:
+                if self._pop(self._storage, None, f"{namespace}\0{key}"):
+                    del index[bisect_left(index, key)]
+
+    def storage_scan(self, namespace, prefix="", start=None, end=None, after=None, limit=None):
+        with self._lock:
+            keys = self._storage_keys(namespace)
+            lower, upper = _key_range(prefix, start, end)
+            lo = bisect_left(keys, lower)
+            if after is not None:
+                lo = max(lo, bisect_right(keys, after))
+            hi = len(keys) if upper is None else bisect_left(keys, upper)
+            if limit is not None:
+                hi = min(hi, lo + int(limit))
+            return [(key, *self._storage.get(f"{namespace}\0{key}")) for key in keys[lo:hi]]
+
+    def storage_clear(self, namespace):
+        with self._writing():
+            keys = self._storage_keys(namespace)
+            for key in keys:
+                self._pop(self._storage, None, f"{namespace}\0{key}")
+            self._storage_index[namespace] = []
+            return len(keys)
+
+    def get_meta(self, key, default=None):
+        with self._lock:
+            return self._meta.get(key, default)
+
+    def set_meta(self, key, value):
+        with self._writing():
+            self._put(self._meta, None, key, value)
+
+    def module_rows(self, module_name=None):
+        with self._lock:
+            if module_name is None:
+                return list(self._modules.values())
+            row = self._modules.get(module_name)
+            return [row] if row is not None else []
+
+    def put_modules(self, rows):
+        with self._writing():
+            for row in rows:
+                self._put(self._modules, "m", row[0], tuple(row))
+
+    def set_module_status(self, module_name, status):
+        with self._writing():
+            row = self._modules.get(module_name)
+            if row is not None:
+                self._put(self._modules, "m", module_name, (row[0], status, *row[2:]))
+
+    def remove_module(self, module_name):
+        with self._writing():
+            return self._pop(self._modules, "m", module_name)
+
+    def last_change_seq(self):
+        return self._seq
+
+    def changes_since(self, seq):
+        with self._lock:
+            return [(change_seq, kind, key) for change_seq, kind, key, _ in self._changes if change_seq > seq]
+
+    def prune_changes(self, before):
+        with self._lock:
+            while len(self._changes) > 1 and self._changes[0][3] < before:
+                self._changes.popleft()
+
+
+class _DbmStore:
+    # 以键前缀区分 config/meta/modules，在同一个 dbm 文件中模拟多张表
+    def __init__(self, backend, prefix, dumps, loads):
+        self._backend = backend
+        self._prefix = prefix.encode()
+        self._dumps = dumps
+        self._loads = loads
+
+    def get(self, key, default=None):
+        raw = self._backend._db().get(self._prefix + key.encode())
+        return default if raw is None else self._loads(raw)
+
+    def __setitem__(self, key, value):
+        self._backend._db()[self._prefix + key.encode()] = self._dumps(value)
+
+    def pop(self, key, default=None):
+        db = self._backend._db()
+        name = self._prefix + key.encode()
+        raw = db.get(name)
+        if raw is None:
+            return default
+        del db[name]
+        return self._loads(raw)
+
+    def __contains__(self, key):
+        return self._prefix + key.encode() in self._backend._db()
+
+    def __iter__(self):
+        size = len(self._prefix)
+        return iter([name[size:].decode() for name in self._backend._db().keys() if name.startswith(self._prefix)])
+
+    def items(self):
+        return [(key, self.get(key)) for key in self]
+
+    def values(self):
+        return [value for _, value in self.items()]
+
+
+def _dump_config(row):
+    # 编码为 "类型|过期时间|值"，数值以十进制文本保存，二进制原样保存
+    type_, value, expires_at = row
+    if isinstance(value, bytes):
+        payload = value
+    elif value is None:
+        payload = b""
+    elif isinstance(value, (int, float)):
+        payload = repr(value).encode()
+    else:
+        payload = value.encode()
+    expires = "" if expires_at is None else repr(expires_at)
+    return f"{type_ or ''}|{expires}|".encode() + payload
+
+
+def _load_config(raw):
+    type_, expires, payload = bytes(raw).split(b"|", 2)
+    type_ = type_.decode() or None
+    expires_at = float(expires) if expires else None
+    if type_ == "y":
+        value = payload
+    elif type_ == "n":
+        value = None
+    elif type_ in ("i", "b"):
+        value = int(payload)
+    elif type_ == "f":
+        value = float(payload)
+    else:
+        value = payload.decode()
+    return type_, value, expires_at
+
+
+class DbmBackend(MemoryBackend):
+    # 基于标准库 dbm 的单文件键值存储，读取无需 SQL 解析，适合只读为主的配置
+    # dbm 不支持多进程并发写入，变更监听也仅覆盖当前进程内的写入
+    name = "dbm"
+
+    def __init__(self, path):
+        super().__init__(path)
+        self._handle = None
+        self._pid = None
+        self._config = _DbmStore(self, "c:", _dump_config, _load_config)
+        self._meta = _DbmStore(self, "x:", str.encode, lambda raw: bytes(raw).decode())
+        self._modules = _DbmStore(
+            self, "m:",
+            lambda row: json.dumps(list(row), ensure_ascii=False).encode(),
+            lambda raw: tuple(json.loads(raw))
+        )
+        self._storage = _DbmStore(
+            self, "s:",
+            lambda row: _dump_config((*row, None)),
+            lambda raw: _load_config(raw)[:2]
+        )
+
+    def _db(self):
+        if self._handle is None or self._pid != os.getpid():
+            with self._lock:
+                if self._handle is None or self._pid != os.getpid():
+                    self._handle = dbm.open(self.path, "c")
+                    self._pid = os.getpid()
+        return self._handle
+
+    def open(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._db()
+        atexit.register(self.close)
+
+    def close(self):
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    @contextmanager
+    def durable(self):
+        yield
+        sync = getattr(self._db(), "sync", None)
+        if sync is not None and not self.in_transaction():
+            with self._lock:
+                sync()
+
+
+_BACKENDS = {
+    "sqlite": SQLiteBackend,
+    "memory": MemoryBackend,
+    "dbm": DbmBackend
+}
+
+
+def create_backend(name, path=None):
+    try:
+        backend_cls = _BACKENDS[name.lower()]
+    except KeyError:
+        raise ValueError(f"未知的配置存储后端: {name}，可选: {', '.join(_BACKENDS)}") from None
+    return backend_cls(path)
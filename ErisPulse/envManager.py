@@ -1,12 +1,36 @@
 import os
 import json
-import sqlite3
+import atexit
+import asyncio
+import functools
+import threading
+import time
 import importlib.util
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 
+_MISSING = object()
+_DELETED = object()
+
+# config 表的值类型标记，type 为 NULL 的行是旧版本写入的纯文本
+_TYPE_STR = "s"
+_TYPE_INT = "i"
+_TYPE_FLOAT = "f"
+_TYPE_BOOL = "b"
+_TYPE_BYTES = "y"
+_TYPE_JSON = "j"
+_TYPE_NONE = "n"
+
 class EnvManager:
     _instance = None
     db_path = os.path.join(os.path.dirname(__file__), "config.db")
+    cache_check_interval = 0.5
+    sweep_interval = 60
+    sweep_batch_size = 500
+    watch_interval = 0.2
+    change_retention = 3600
 
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
@@ -17,211 +41,1081 @@ class EnvManager:
     def __init__(self, dev_mode=False):
         if not hasattr(self, "_initialized"):
             self.dev_mode = dev_mode
-            self._init_db()
-    
-    def _init_db(self):
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS config (
-            key TEXT PRIMARY KEY,
-            value TEXT NOT NULL
-        )
-        """)
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS modules (
-            module_name TEXT PRIMARY KEY,
-            status INTEGER NOT NULL,
-            version TEXT,
-            description TEXT,
-            author TEXT,
-            dependencies TEXT,
-            optional_dependencies TEXT,
-            pip_dependencies TEXT
-        )
-        """)
-        conn.commit()
-        conn.close()
+            self._local = threading.local()
+            self._backend_lock = threading.Lock()
+            self._open_lock = threading.RLock()
+            self._cache = {}
+            self._cache_gen = 0
+            self._cache_epoch = 0
+            self._cache_lock = threading.Lock()
+            self._cache_checked_at = 0.0
+            self._io_executor = None
+            self._pending_writes = {}
+            self._pending_waiters = []
+            self._pending_lock = threading.Lock()
+            self._flush_scheduled = False
+            self._write_policies = {}
+            self._policy_cache = {}
+            self._behind_writes = {}
+            self._behind_deltas = {}
+            self._behind_expiry = {}
+            # 正在落盘的缓冲，落盘期间仍可读取；_flush_active 为 True 时其他 flush() 等待其完成
+            self._flushing_writes = {}
+            self._flushing_deltas = {}
+            self._flushing_expiry = {}
+            self._flush_active = False
+            self._flush_committed = False
+            self._flush_commit_lock = threading.Lock()
+            self._behind_cond = threading.Condition(threading.RLock())
+            self._behind_deadline = None
+            self._behind_thread = None
+            self._sweeper = None
+            self._sweeper_stop = threading.Event()
+            self._watchers = {}
+            self._watch_token = 0
+            self._watch_lock = threading.Lock()
+            self._watch_thread = None
+            self._watch_wakeup = threading.Event()
+            self._watch_stop = threading.Event()
+            self._namespaces = {}
+            self._initialized = True
+            atexit.register(self.flush)
 
-    def get(self, key, default=None):
+    @property
+    def backend(self):
+        return self._backend
+
+    def _open(self):
+        # 首次访问 _backend 时才打开默认后端并加载 env.py，import ErisPulse 本身不产生任何 I/O
+        with self._open_lock:
+            if "_backend" not in self.__dict__:
+                self.use_backend(
+                    os.environ.get("ERISPULSE_ENV_BACKEND", "sqlite"),
+                    os.environ.get("ERISPULSE_ENV_PATH") or None
+                )
+                self.load_env_file()
+        return self._backend
+
+    def use_backend(self, backend, path=None):
+        # backend 可以是后端名称（sqlite/memory/dbm）或 BaseBackend 实例
+        # 未指定 path 时 sqlite 使用 db_path，dbm 使用同目录下的 config.dbm
+        from .envBackend import BaseBackend, create_backend
+
+        if not isinstance(backend, BaseBackend):
+            backend = backend.lower()
+            if path is None and backend != "memory":
+                path = self.db_path if backend == "sqlite" else os.path.splitext(self.db_path)[0] + ".dbm"
+            backend = create_backend(backend, path)
+
+        previous = self.__dict__.get("_backend")
+        if previous is not None:
+            self.flush()
+            if self._io_executor is not None:
+                self._io_executor.submit(self._flush_pending).result()
+        backend.open()
+        backend.on_commit = self._wake_watchers
+        with self._backend_lock:
+            self._backend = backend
+            self._local = threading.local()
+        self._invalidate()
+        # 变更序列由触发器在每次写入时追加，无论是否有监听者都需要定期清理
+        self._prune_changes()
+        self._ensure_sweeper()
+        if previous is not None:
+            previous.close()
+            self._restart_watch()
+
+    def _restart_watch(self):
+        # 切换后端后从新后端的当前序号开始监听
+        thread = self._watch_thread
+        if thread is not None and thread.is_alive():
+            self._watch_stop.set()
+            self._watch_wakeup.set()
+            thread.join()
+            self._watch_thread = None
+        with self._watch_lock:
+            if self._watchers:
+                self._start_watch()
+
+    def close(self):
+        self.flush()
+        self._sweeper_stop.set()
+        self._watch_stop.set()
+        self._watch_wakeup.set()
+        if self._io_executor is not None:
+            # 等待已排队的异步写入落盘
+            self._io_executor.shutdown(wait=True)
+            self._io_executor = None
+        backend = self.__dict__.get("_backend")
+        if backend is not None:
+            backend.close()
+        self._local = threading.local()
+
+    @contextmanager
+    def transaction(self):
+        # 事务中的读取不经过共享缓存，写入的键在提交后才失效，其他线程不会读到未提交的值
+        local = self._local
+        if getattr(local, "tx_keys", None) is not None:
+            with self._backend.transaction():
+                yield self
+            return
+        local.tx_keys, local.tx_namespaces, local.tx_all = set(), [], False
+        committed = False
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT value FROM config WHERE key = ?", (key,))
-                result = cursor.fetchone()
-            if result:
-                try:
-                    return json.loads(result[0])
-                except json.JSONDecodeError:
-                    return result[0]
+            with self._backend.transaction():
+                yield self
+            committed = True
+        finally:
+            keys, namespaces, invalidate_all = local.tx_keys, local.tx_namespaces, local.tx_all
+            local.tx_keys = local.tx_namespaces = None
+            if not committed or invalidate_all:
+                self._invalidate()
+            else:
+                self._invalidate(keys=keys)
+                for namespace, namespace_keys in namespaces:
+                    namespace._invalidate(namespace_keys)
+
+    def _in_transaction(self):
+        return getattr(self._local, "tx_keys", None) is not None
+
+    def _invalidate(self, key=None, keys=None):
+        # 只传入 key 或 keys 时仅失效这些键，都不传时整体失效
+        local = self._local
+        if getattr(local, "tx_keys", None) is not None:
+            # 事务中的写入推迟到提交后失效
+            if key is None and keys is None:
+                local.tx_all = True
+            else:
+                local.tx_keys.update((key,) if keys is None else keys)
+            return
+        with self._cache_lock:
+            self._cache_gen += 1
+            if key is None and keys is None:
+                # 命名空间的缓存在下次访问时比较 epoch 后整体丢弃
+                self._cache_epoch += 1
+                self._cache.clear()
+            elif keys is None:
+                self._cache.pop(key, None)
+            else:
+                for key in keys:
+                    self._cache.pop(key, None)
+
+    def _sync_cache(self):
+        # 后端的 data_version 仅在其他连接（含其他进程）提交后变化，用于发现外部写入
+        local = self._local
+        now = time.monotonic()
+        if now - getattr(local, "checked_at", 0.0) < self.cache_check_interval:
+            return
+        local.checked_at = now
+        version = self._backend.data_version()
+        if version != getattr(local, "data_version", None):
+            local.data_version = version
+            self._invalidate()
+        self._cache_checked_at = now
+
+    def _cache_value(self, key, gen, value, raw, expires_at=None):
+        # dict/list 缓存原始 JSON，命中时重新解码，避免调用方修改共享对象
+        if isinstance(value, (dict, list)):
+            entry = (None, raw, expires_at)
+        else:
+            entry = (value, None, expires_at)
+        with self._cache_lock:
+            if gen == self._cache_gen:
+                self._cache[key] = entry
+
+    def _from_cache(self, cached, default):
+        value, raw, expires_at = cached
+        if expires_at is not None and expires_at <= time.time():
             return default
-        except sqlite3.OperationalError as e:
-            if "no such table" in str(e):
-                self._init_db()
-                return self.get(key, default)
+        if raw is not None:
+            return json.loads(raw)
+        return default if value is _MISSING else value
+
+    def get(self, key, default=None):
+        if self._is_buffered(key):
+            return self._get_buffered(key, default)
+        return self._get_stored(key, default)
+
+    def _is_buffered(self, key):
+        return (key in self._behind_writes or key in self._behind_deltas
+                or key in self._flushing_writes or key in self._flushing_deltas)
+
+    def _get_stored(self, key, default=None):
+        if self._in_transaction():
+            return self._get_uncached(key, default)
+        self._sync_cache()
+        cached = self._cache.get(key)
+        if cached is not None:
+            return self._from_cache(cached, default)
+
+        gen = self._cache_gen
+        result = self._backend.get_row(key)
+        if result:
+            type_, raw, expires_at = result
+            value = self._deserialize(type_, raw)
+            self._cache_value(key, gen, value, raw, expires_at)
+            if expires_at is not None and expires_at <= time.time():
+                self._ensure_sweeper()
+                return default
+            return value
+        self._cache_value(key, gen, _MISSING, None)
+        return default
+
+    def _get_uncached(self, key, default=None):
+        row = self._backend.get_row(key)
+        if not row or (row[2] is not None and row[2] <= time.time()):
+            return default
+        return self._deserialize(row[0], row[1])
+
+    def get_many(self, keys, default=None):
+        if self._in_transaction():
+            return {
+                key: self._get_buffered(key, default) if self._is_buffered(key) else self._get_uncached(key, default)
+                for key in keys
+            }
+        self._sync_cache()
+        results = {}
+        pending = []
+        for key in keys:
+            if self._is_buffered(key):
+                results[key] = self._get_buffered(key, default)
+                continue
+            cached = self._cache.get(key)
+            if cached is None:
+                pending.append(key)
+                continue
+            results[key] = self._from_cache(cached, default)
+
+        gen = self._cache_gen
+        found = self._backend.get_rows(pending) if pending else {}
+        for key in pending:
+            if key in found:
+                type_, raw, expires_at = found[key]
+                value = self._deserialize(type_, raw)
+                self._cache_value(key, gen, value, raw, expires_at)
+                if expires_at is not None and expires_at <= time.time():
+                    value = default
+                results[key] = value
             else:
-                raise
+                self._cache_value(key, gen, _MISSING, None)
+                results[key] = default
+        return {key: results[key] for key in keys}
 
-    def set(self, key, value):
-        serialized_value = json.dumps(value) if isinstance(value, (dict, list)) else str(value)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)", (key, serialized_value))
-        conn.commit()
-        conn.close()
+    def scan(self, prefix="", limit=None):
+        # 按键名顺序返回 (key, value) 列表，跳过已过期的键
+        # 事务中不会落盘写缓冲，缓冲中的值叠加在存储的结果上
+        buffered = ()
+        if self._backend.in_transaction():
+            with self._behind_cond:
+                buffered = {
+                    key for buffer in (self._behind_writes, self._behind_deltas,
+                                       self._flushing_writes, self._flushing_deltas)
+                    for key in buffer if key.startswith(prefix)
+                }
+        else:
+            self.flush()
+        now = time.time()
+        results = {
+            key: self._deserialize(type_, raw)
+            for key, type_, raw, expires_at in self._backend.scan(prefix, limit=None if buffered else limit)
+            if expires_at is None or expires_at > now
+        }
+        if not buffered:
+            return list(results.items())
+        for key in buffered:
+            value = self._get_buffered(key, _MISSING)
+            if value is _MISSING:
+                results.pop(key, None)
+            else:
+                results[key] = value
+        return sorted(results.items())[:limit]
+
+    @staticmethod
+    def _serialize(value):
+        # 返回 (类型标记, 存储值)，数值与二进制直接以 SQLite 原生类型存储
+        if value is None:
+            return _TYPE_NONE, None
+        if isinstance(value, bool):
+            return _TYPE_BOOL, int(value)
+        if isinstance(value, int):
+            if -2 ** 63 <= value < 2 ** 63:
+                return _TYPE_INT, value
+            return _TYPE_INT, str(value)
+        if isinstance(value, float):
+            return _TYPE_FLOAT, value
+        if isinstance(value, str):
+            return _TYPE_STR, value
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return _TYPE_BYTES, bytes(value)
+        if isinstance(value, (dict, list, tuple)):
+            return _TYPE_JSON, json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        return _TYPE_STR, str(value)
+
+    @staticmethod
+    def _deserialize(type_, raw):
+        if type_ == _TYPE_STR:
+            return raw
+        if type_ == _TYPE_INT:
+            return int(raw)
+        if type_ == _TYPE_FLOAT:
+            return float(raw)
+        if type_ == _TYPE_BOOL:
+            return bool(raw)
+        if type_ == _TYPE_BYTES:
+            return bytes(raw)
+        if type_ == _TYPE_JSON:
+            return json.loads(raw)
+        if type_ == _TYPE_NONE:
+            return None
+        # 旧格式：dict/list 为 JSON，其余值为 str(value)
+        try:
+            return json.loads(raw)
+        except (TypeError, json.JSONDecodeError):
+            return raw
+
+    def _expires_at(self, ttl):
+        if ttl is None:
+            return None
+        self._ensure_sweeper()
+        return time.time() + ttl
+
+    def set(self, key, value, ttl=None):
+        expires_at = self._expires_at(ttl)
+        policy = self._policy_for(key)
+        if policy and policy["write_behind"]:
+            self._buffer_write(key, value, policy, expires_at)
+            return
+        type_, serialized_value = self._serialize(value)
+        with self._durability(policy):
+            self._backend.put_rows([(key, type_, serialized_value, expires_at)])
+        self._invalidate(key)
+
+    def set_many(self, items, ttl=None):
+        expires_at = self._expires_at(ttl)
+        rows = []
+        durable = None
+        for key, value in dict(items).items():
+            policy = self._policy_for(key)
+            if policy and policy["write_behind"]:
+                self._buffer_write(key, value, policy, expires_at)
+                continue
+            if policy and policy["durable"]:
+                durable = policy
+            rows.append((key, *self._serialize(value), expires_at))
+        if not rows:
+            return
+        with self._durability(durable):
+            self._backend.put_rows(rows)
+        self._invalidate(keys=[row[0] for row in rows])
 
     def delete(self, key):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM config WHERE key = ?", (key,))
-        conn.commit()
-        conn.close()
+        policy = self._policy_for(key)
+        if policy and policy["write_behind"]:
+            self._buffer_write(key, _DELETED, policy)
+            return
+        with self._durability(policy):
+            self._backend.delete_rows([key])
+        self._invalidate(key)
+
+    def incr(self, key, delta=1, ttl=None):
+        # ttl 仅在键新建（或已过期）时生效，适用于固定窗口计数
+        expires_at = self._expires_at(ttl)
+        policy = self._policy_for(key)
+        if policy and policy["write_behind"]:
+            return self._buffer_incr(key, delta, policy, expires_at)
+        with self._durability(policy):
+            row = self._backend.incr(key, self._incr_type(delta), delta, expires_at, time.time())
+        self._invalidate(key)
+        if row[0] not in (_TYPE_INT, _TYPE_FLOAT):
+            raise TypeError(f"配置项 {key} 不是数值类型，无法自增")
+        return self._deserialize(*row)
+
+    def _incr_type(self, delta):
+        return _TYPE_FLOAT if isinstance(delta, float) else _TYPE_INT
+
+    def set_write_policy(self, prefix, write_behind=False, flush_interval=1.0, durable=False):
+        # write_behind: 写入先进入内存，按 flush_interval 批量落盘
+        # durable: 提交时使用 synchronous=FULL，牺牲吞吐换取掉电安全
+        self.flush()
+        with self._behind_cond:
+            if write_behind or durable:
+                self._write_policies[prefix] = {
+                    "write_behind": bool(write_behind),
+                    "flush_interval": float(flush_interval),
+                    "durable": bool(durable)
+                }
+            else:
+                self._write_policies.pop(prefix, None)
+            self._policy_cache = {}
+
+    def _policy_for(self, key):
+        if not self._write_policies:
+            return None
+        policy = self._policy_cache.get(key, _MISSING)
+        if policy is _MISSING:
+            # 最长前缀优先
+            policy = None
+            matched = -1
+            for prefix, candidate in self._write_policies.items():
+                if key.startswith(prefix) and len(prefix) > matched:
+                    policy, matched = candidate, len(prefix)
+            if len(self._policy_cache) > 4096:
+                self._policy_cache = {}
+            self._policy_cache[key] = policy
+        return policy
+
+    def _durability(self, policy):
+        if not policy or not policy["durable"]:
+            return nullcontext()
+        return self._backend.durable()
+
+    def _get_buffered(self, key, default):
+        with self._behind_cond:
+            expires_at = self._behind_expiry.get(key)
+            if expires_at is not None and expires_at <= time.time():
+                return default
+            return self._buffered_value(key, default)
+
+    def _buffered_value(self, key, default):
+        # 调用方持有 _behind_cond；依次叠加缓冲、正在落盘的缓冲与已存储的值
+        value = self._behind_writes.get(key, _MISSING)
+        if value is not _MISSING:
+            return default if value is _DELETED else value
+        delta = self._behind_deltas.get(key)
+        base = self._flushing_writes.get(key, _MISSING)
+        if base is not _MISSING:
+            expires_at = self._flushing_expiry.get(key)
+            if base is _DELETED or (expires_at is not None and expires_at <= time.time()):
+                return default if delta is None else delta
+        elif key in self._flushing_deltas:
+            base = self._flushing_base(key)
+        elif delta is None:
+            return self._get_stored(key, default)
+        else:
+            return self._get_stored(key, 0) + delta
+        return base if delta is None else base + delta
+
+    def _flushing_base(self, key):
+        # 提交与 _flush_committed 在同一把锁内更新：提交前为存储值加正在落盘的增量，提交后存储值已包含该增量
+        # 直接读取后端而不经过读缓存，缓存在提交之后才失效
+        with self._flush_commit_lock:
+            row = self._backend.get_row(key)
+            committed = self._flush_committed
+        value = 0
+        if row and (row[2] is None or row[2] > time.time()):
+            value = self._deserialize(row[0], row[1])
+        return value if committed else value + self._flushing_deltas[key]
+
+    def _buffer_write(self, key, value, policy, expires_at=None):
+        with self._behind_cond:
+            self._behind_writes[key] = value
+            self._behind_deltas.pop(key, None)
+            self._behind_expiry[key] = expires_at
+            self._schedule_flush(policy["flush_interval"])
+
+    def _buffer_incr(self, key, delta, policy, expires_at=None):
+        with self._behind_cond:
+            current_expiry = self._behind_expiry.get(key)
+            if current_expiry is not None and current_expiry <= time.time():
+                # 缓冲中的值已过期，重新开始计数
+                self._behind_writes.pop(key, None)
+                self._behind_deltas.pop(key, None)
+                self._behind_expiry.pop(key, None)
+            if expires_at is not None:
+                self._behind_expiry.setdefault(key, expires_at)
+            value = self._behind_writes.get(key, _MISSING)
+            if value is _DELETED:
+                value = delta
+                self._behind_writes[key] = value
+            elif value is not _MISSING:
+                value = value + delta
+                self._behind_writes[key] = value
+            else:
+                self._behind_deltas[key] = self._behind_deltas.get(key, 0) + delta
+                value = self._buffered_value(key, 0)
+            self._schedule_flush(policy["flush_interval"])
+            return value
+
+    def _schedule_flush(self, interval):
+        deadline = time.monotonic() + interval
+        if self._behind_deadline is None or deadline < self._behind_deadline:
+            self._behind_deadline = deadline
+            self._behind_cond.notify()
+        if self._behind_thread is None or not self._behind_thread.is_alive():
+            self._behind_thread = threading.Thread(
+                target=self._flush_loop, name="ErisPulse-env-flush", daemon=True
+            )
+            self._behind_thread.start()
+
+    def _flush_loop(self):
+        while True:
+            with self._behind_cond:
+                while True:
+                    if self._behind_deadline is None:
+                        self._behind_cond.wait()
+                        continue
+                    timeout = self._behind_deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    self._behind_cond.wait(timeout)
+            try:
+                self.flush()
+            except Exception:
+                # 落盘失败时缓冲内容已放回，稍后重试
+                with self._behind_cond:
+                    self._behind_deadline = time.monotonic() + 1.0
+
+    def flush(self):
+        # 当前线程处于事务中时不落盘：嵌套事务不会单独提交，外层回滚会丢失已取出的缓冲，留待事务结束后由落盘线程写入
+        backend = self.__dict__.get("_backend")
+        if backend is not None and backend.in_transaction():
+            return
+        with self._behind_cond:
+            # 等待其他线程正在进行的落盘，保证返回时此前的写入都已提交
+            while self._flush_active:
+                self._behind_cond.wait()
+            writes = self._behind_writes
+            deltas = self._behind_deltas
+            expiry = self._behind_expiry
+            self._behind_deadline = None
+            if not writes and not deltas:
+                return
+            self._flushing_writes, self._flushing_deltas, self._flushing_expiry = writes, deltas, expiry
+            self._behind_writes, self._behind_deltas, self._behind_expiry = {}, {}, {}
+            self._flush_active = True
+            self._flush_committed = False
+        # 写入数据库时不持有 _behind_cond：其他线程可能已持有数据库写锁，正在等待写入缓冲
+        committed = locked = False
+        try:
+            with self.transaction():
+                self._backend.put_rows([
+                    (key, *self._serialize(value), expiry.get(key))
+                    for key, value in writes.items() if value is not _DELETED
+                ])
+                self._backend.delete_rows([key for key, value in writes.items() if value is _DELETED])
+                self._backend.incr_many([
+                    (key, self._incr_type(delta), delta, expiry.get(key)) for key, delta in deltas.items()
+                ], time.time())
+                self._invalidate(keys=[*writes, *deltas])
+                # 提交只在已取得写锁后进行，不会长时间占用 _flush_commit_lock
+                self._flush_commit_lock.acquire()
+                locked = True
+            self._flush_committed = committed = True
+        finally:
+            if locked:
+                self._flush_commit_lock.release()
+            with self._behind_cond:
+                if not committed:
+                    self._restore_buffers(writes, deltas, expiry)
+                self._flushing_writes, self._flushing_deltas, self._flushing_expiry = {}, {}, {}
+                self._flush_active = False
+                self._behind_cond.notify_all()
+
+    def _restore_buffers(self, writes, deltas, expiry):
+        # 落盘失败时把取出的缓冲放回，期间的新写入覆盖旧值，新的增量叠加在旧值上
+        for key, value in writes.items():
+            if key in self._behind_writes:
+                continue
+            delta = self._behind_deltas.pop(key, None)
+            if delta is not None:
+                value = delta if value is _DELETED else value + delta
+            self._behind_writes[key] = value
+            self._behind_expiry.setdefault(key, expiry.get(key))
+        for key, delta in deltas.items():
+            if key in self._behind_writes:
+                continue
+            self._behind_deltas[key] = delta + self._behind_deltas.get(key, 0)
+            self._behind_expiry.setdefault(key, expiry.get(key))
+        if self._behind_deadline is None:
+            self._behind_deadline = time.monotonic() + 1.0
+
+    def _ensure_sweeper(self):
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+        with self._backend_lock:
+            if self._sweeper is not None and self._sweeper.is_alive():
+                return
+            self._sweeper_stop.clear()
+            self._sweeper = threading.Thread(target=self._sweep_loop, name="ErisPulse-env-sweeper", daemon=True)
+            self._sweeper.start()
+
+    def _sweep_loop(self):
+        while not self._sweeper_stop.wait(self.sweep_interval):
+            try:
+                self.purge_expired()
+            except Exception:
+                pass
+            self._prune_changes()
+
+    def _prune_changes(self):
+        try:
+            self._backend.prune_changes(time.time() - self.change_retention)
+        except Exception:
+            pass
+
+    def purge_expired(self):
+        # 分批删除已过期的键，避免长时间持有写锁
+        removed = 0
+        while True:
+            count = self._backend.purge_expired(time.time(), self.sweep_batch_size)
+            removed += count
+            if count < self.sweep_batch_size:
+                break
+        if removed:
+            self._invalidate()
+        return removed
     
     def clear(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM config")
-        conn.commit()
-        conn.close()
+        self._backend.clear()
+        self._invalidate()
 
     def load_env_file(self):
         env_file = Path("env.py")
-        if env_file.exists():
-            spec = importlib.util.spec_from_file_location("env_module", env_file)
-            env_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(env_module)
-            for key, value in vars(env_module).items():
-                if not key.startswith("__") and isinstance(value, (dict, list, str, int, float, bool)):
-                    self.set(key, value)
+        if not env_file.exists():
+            return
+
+        # env.py 每次都会执行（其中的值可能来自 os.environ 等外部状态），执行结果与存储一致时不产生写操作
+        spec = importlib.util.spec_from_file_location("env_module", env_file)
+        env_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(env_module)
+        snapshot = {
+            key: self._serialize(value) for key, value in vars(env_module).items()
+            if not key.startswith("__") and isinstance(value, (dict, list, str, int, float, bool))
+        }
+
+        stored = self._backend.get_rows(list(snapshot))
+        changed = [
+            (key, type_, raw, None) for key, (type_, raw) in snapshot.items()
+            if tuple(stored.get(key, ())) != (type_, raw, None)
+        ]
+        if changed:
+            self._backend.put_rows(changed)
+            self._invalidate(keys=[row[0] for row in changed])
+
     def set_module_status(self, module_name, status):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-            UPDATE modules SET status = ? WHERE module_name = ?
-            """, (int(status), module_name))
-            conn.commit()
+        self._backend.set_module_status(module_name, int(status))
     
     def get_module_status(self, module_name):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-            SELECT status FROM modules WHERE module_name = ?
-            """, (module_name,))
-            result = cursor.fetchone()
-            return bool(result[0]) if result else True
+        rows = self._backend.module_rows(module_name)
+        return bool(rows[0][1]) if rows else True
+
+    def _module_row(self, module_name, module_info):
+        meta = module_info.get('info', {}).get('meta', {})
+        dependencies = module_info.get('info', {}).get('dependencies', {})
+        return (
+            module_name,
+            int(module_info.get('status', True)),
+            meta.get('version', ''),
+            meta.get('description', ''),
+            meta.get('author', ''),
+            json.dumps(dependencies.get('requires', [])),
+            json.dumps(dependencies.get('optional', [])),
+            json.dumps(dependencies.get('pip', []))
+        )
+
+    def _module_info(self, row):
+        module_name, status, version, description, author, dependencies, optional_dependencies, pip_dependencies = row
+        return {
+            'status': bool(status),
+            'info': {
+                'meta': {
+                    'version': version,
+                    'description': description,
+                    'author': author,
+                    'pip_dependencies': json.loads(pip_dependencies) if pip_dependencies else []
+                },
+                'dependencies': {
+                    'requires': json.loads(dependencies) if dependencies else [],
+                    'optional': json.loads(optional_dependencies) if optional_dependencies else [],
+                    'pip': json.loads(pip_dependencies) if pip_dependencies else []
+                }
+            }
+        }
 
     def set_all_modules(self, modules_info):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            for module_name, module_info in modules_info.items():
-                meta = module_info.get('info', {}).get('meta', {})
-                dependencies = module_info.get('info', {}).get('dependencies', {})
-                cursor.execute("""
-                INSERT OR REPLACE INTO modules (
-                    module_name, status, version, description, author, 
-                    dependencies, optional_dependencies, pip_dependencies
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    module_name,
-                    int(module_info.get('status', True)),
-                    meta.get('version', ''),
-                    meta.get('description', ''),
-                    meta.get('author', ''),
-                    json.dumps(dependencies.get('requires', [])),
-                    json.dumps(dependencies.get('optional', [])),
-                    json.dumps(dependencies.get('pip', []))
-                ))
-            conn.commit()
+        # 只写入与存储中不一致的行，全部未变化时不产生写操作
+        rows = [self._module_row(module_name, module_info) for module_name, module_info in modules_info.items()]
+        if not rows:
+            return
+        stored = set(tuple(row) for row in self._backend.module_rows())
+        changed = [row for row in rows if row not in stored]
+        if not changed:
+            return
+        self._backend.put_modules(changed)
 
     def get_all_modules(self):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM modules")
-            rows = cursor.fetchall()
-            modules_info = {}
-            for row in rows:
-                module_name, status, version, description, author, dependencies, optional_dependencies, pip_dependencies = row
-                modules_info[module_name] = {
-                    'status': bool(status),
-                    'info': {
-                        'meta': {
-                            'version': version,
-                            'description': description,
-                            'author': author,
-                            'pip_dependencies': json.loads(pip_dependencies) if pip_dependencies else []
-                        },
-                        'dependencies': {
-                            'requires': json.loads(dependencies) if dependencies else [],
-                            'optional': json.loads(optional_dependencies) if optional_dependencies else [],
-                            'pip': json.loads(pip_dependencies) if pip_dependencies else []
-                        }
-                    }
-                }
-            return modules_info
+        return {row[0]: self._module_info(row) for row in self._backend.module_rows()}
 
     def set_module(self, module_name, module_info):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            meta = module_info.get('info', {}).get('meta', {})
-            dependencies = module_info.get('info', {}).get('dependencies', {})
-            cursor.execute("""
-            INSERT OR REPLACE INTO modules (
-                module_name, status, version, description, author, 
-                dependencies, optional_dependencies, pip_dependencies
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                module_name,
-                int(module_info.get('status', True)),
-                meta.get('version', ''),
-                meta.get('description', ''),
-                meta.get('author', ''),
-                json.dumps(dependencies.get('requires', [])),
-                json.dumps(dependencies.get('optional', [])),
-                json.dumps(dependencies.get('pip', []))
-            ))
-            conn.commit()
+        self._backend.put_modules([self._module_row(module_name, module_info)])
 
     def get_module(self, module_name):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM modules WHERE module_name = ?", (module_name,))
-            row = cursor.fetchone()
-            if row:
-                module_name, status, version, description, author, dependencies, optional_dependencies, pip_dependencies = row
-                return {
-                    'status': bool(status),
-                    'info': {
-                        'meta': {
-                            'version': version,
-                            'description': description,
-                            'author': author,
-                            'pip_dependencies': json.loads(pip_dependencies) if pip_dependencies else []
-                        },
-                        'dependencies': {
-                            'requires': json.loads(dependencies) if dependencies else [],
-                            'optional': json.loads(optional_dependencies) if optional_dependencies else [],
-                            'pip': json.loads(pip_dependencies) if pip_dependencies else []
-                        }
-                    }
-                }
-            return None
+        rows = self._backend.module_rows(module_name)
+        return self._module_info(rows[0]) if rows else None
 
     def update_module(self, module_name, module_info):
         self.set_module(module_name, module_info)
 
     def remove_module(self, module_name):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM modules WHERE module_name = ?", (module_name,))
-            conn.commit()
-            return cursor.rowcount > 0
+        return self._backend.remove_module(module_name)
+
+    def get_module_manifest(self):
+        try:
+            return json.loads(self._backend.get_meta("module_manifest", "{}"))
+        except json.JSONDecodeError:
+            return {}
+
+    def set_module_manifest(self, manifest):
+        self._backend.set_meta("module_manifest", json.dumps(manifest, ensure_ascii=False))
     
+    def _io(self):
+        # 所有异步接口共用一个 I/O 线程，写入天然串行
+        if self._io_executor is None:
+            with self._backend_lock:
+                if self._io_executor is None:
+                    self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ErisPulse-env")
+        return self._io_executor
+
+    async def _run_io(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io(), functools.partial(func, *args))
+
+    def _enqueue_write(self, key, value, ttl=None):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._pending_lock:
+            self._pending_writes[key] = (value, ttl)
+            self._pending_waiters.append((loop, future))
+            schedule = not self._flush_scheduled
+            self._flush_scheduled = True
+        if schedule:
+            self._io().submit(self._flush_pending)
+        return future
+
+    def _flush_pending(self):
+        # 合并期间累积的所有写入，在一个事务中提交
+        with self._pending_lock:
+            writes, self._pending_writes = self._pending_writes, {}
+            waiters, self._pending_waiters = self._pending_waiters, []
+            self._flush_scheduled = False
+        if not waiters:
+            return
+
+        error = None
+        try:
+            with self.transaction():
+                for key, (value, ttl) in writes.items():
+                    if value is _DELETED:
+                        self.delete(key)
+                    else:
+                        self.set(key, value, ttl=ttl)
+        except Exception as e:
+            error = e
+
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve_future, future, error)
+            except RuntimeError:
+                pass
+
+    async def aget(self, key, default=None):
+        pending = self._pending_writes.get(key)
+        if pending is not None:
+            value = pending[0]
+            return default if value is _DELETED else value
+        if self._is_buffered(key):
+            return await self._run_io(self.get, key, default)
+        cached = None if self._in_transaction() else self._cache.get(key)
+        if cached is not None and time.monotonic() - self._cache_checked_at < self.cache_check_interval:
+            return self._from_cache(cached, default)
+        return await self._run_io(self.get, key, default)
+
+    async def aget_many(self, keys, default=None):
+        return await self._run_io(self.get_many, list(keys), default)
+
+    async def aset(self, key, value, ttl=None):
+        await self._enqueue_write(key, value, ttl)
+
+    async def aset_many(self, items, ttl=None):
+        futures = [self._enqueue_write(key, value, ttl) for key, value in dict(items).items()]
+        if futures:
+            await asyncio.gather(*futures)
+
+    async def adelete(self, key):
+        await self._enqueue_write(key, _DELETED)
+
+    async def aincr(self, key, delta=1, ttl=None):
+        return await self._run_io(self.incr, key, delta, ttl)
+
+    async def aflush(self):
+        await self._run_io(self._flush_pending)
+
+    async def aset_module_status(self, module_name, status):
+        await self._run_io(self.set_module_status, module_name, status)
+
+    async def aget_module_status(self, module_name):
+        return await self._run_io(self.get_module_status, module_name)
+
+    async def aset_module(self, module_name, module_info):
+        await self._run_io(self.set_module, module_name, module_info)
+
+    async def aget_module(self, module_name):
+        return await self._run_io(self.get_module, module_name)
+
+    async def aget_all_modules(self):
+        return await self._run_io(self.get_all_modules)
+
+    async def aremove_module(self, module_name):
+        return await self._run_io(self.remove_module, module_name)
+
+    def watch(self, key, callback, prefix=False):
+        # callback(key, value) 在配置变化后调用，value 为最新值（已删除时为 None）
+        return self._add_watcher("c", key, callback, prefix)
+
+    def watch_module(self, module_name, callback):
+        # module_name 为 None 时监听所有模块，callback(module_name, module_info)
+        return self._add_watcher("m", module_name or "", callback, module_name is None)
+
+    def unwatch(self, token):
+        with self._watch_lock:
+            return self._watchers.pop(token, None) is not None
+
+    async def awatch(self, key, prefix=False):
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        token = self.watch(
+            key, lambda changed_key, value: loop.call_soon_threadsafe(queue.put_nowait, (changed_key, value)),
+            prefix=prefix
+        )
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.unwatch(token)
+
+    def _add_watcher(self, kind, key, callback, prefix):
+        loop = None
+        if asyncio.iscoroutinefunction(callback):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                raise ValueError("异步回调需要在事件循环中注册") from None
+        with self._watch_lock:
+            self._watch_token += 1
+            token = self._watch_token
+            self._watchers[token] = (kind, key, prefix, callback, loop)
+            if self._watch_thread is None or not self._watch_thread.is_alive():
+                self._start_watch()
+        return token
+
+    def _start_watch(self):
+        # 在调用线程中确定起始序号，避免线程启动前的变更被漏掉
+        last_seq = self._backend.last_change_seq()
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop, args=(last_seq,), name="ErisPulse-env-watch", daemon=True
+        )
+        self._watch_thread.start()
+
+    def _wake_watchers(self):
+        if self._watchers:
+            self._watch_wakeup.set()
+
+    def _watch_loop(self, last_seq):
+        data_version = None
+        while not self._watch_stop.is_set():
+            woken = self._watch_wakeup.wait(self.watch_interval)
+            self._watch_wakeup.clear()
+            if self._watch_stop.is_set():
+                break
+            try:
+                backend = self._backend
+                # 本进程的提交会唤醒线程；其他进程提交时 data_version 变化，空闲轮询几乎没有开销
+                version = backend.data_version()
+                if not woken and version == data_version:
+                    continue
+                data_version = version
+                rows = backend.changes_since(last_seq)
+                if rows:
+                    last_seq = rows[-1][0]
+                    for kind, key in dict.fromkeys((kind, key) for _, kind, key in rows):
+                        self._dispatch_change(kind, key)
+            except Exception:
+                continue
+
+    def _dispatch_change(self, kind, key):
+        with self._watch_lock:
+            watchers = [
+                (callback, loop) for watch_kind, watch_key, prefix, callback, loop in self._watchers.values()
+                if watch_kind == kind and (key.startswith(watch_key) if prefix else key == watch_key)
+            ]
+        if kind == "c":
+            self._invalidate(key)
+        if not watchers:
+            return
+        value = self.get(key) if kind == "c" else self.get_module(key)
+        for callback, loop in watchers:
+            try:
+                if loop is not None:
+                    asyncio.run_coroutine_threadsafe(callback(key, value), loop)
+                else:
+                    callback(key, value)
+            except Exception as e:
+                from . import logger
+                logger.error(f"配置监听回调执行失败: {e}")
+
+    def namespace(self, name, cache_size=256):
+        # 每个模块独立的键空间，与 config 表以及其他模块互不干扰
+        if not name or "\0" in name:
+            raise ValueError(f"无效的命名空间名称: {name!r}")
+        with self._backend_lock:
+            namespace = self._namespaces.get(name)
+            if namespace is None:
+                namespace = self._namespaces[name] = EnvNamespace(self, name, cache_size)
+            return namespace
+
     def __getattr__(self, key):
+        if key == "_backend":
+            return self._open()
+        if key.startswith("_"):
+            raise AttributeError(key)
         try:
             return self.get(key)
         except KeyError:
             raise AttributeError(f"配置项 {key} 不存在")
 
+class EnvNamespace:
+    def __init__(self, manager, name, cache_size=256):
+        self._manager = manager
+        self.name = name
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._gen = 0
+        self._epoch = None
+
+    def _sync_cache(self):
+        self._manager._sync_cache()
+        epoch = self._manager._cache_epoch
+        if epoch != self._epoch:
+            with self._cache_lock:
+                self._cache.clear()
+                self._epoch = epoch
+
+    def _invalidate(self, keys=None):
+        local = self._manager._local
+        if getattr(local, "tx_keys", None) is not None:
+            # 事务中的写入推迟到提交后失效
+            if keys is None:
+                local.tx_all = True
+            else:
+                local.tx_namespaces.append((self, keys))
+            return
+        with self._cache_lock:
+            self._gen += 1
+            if keys is None:
+                self._cache.clear()
+            else:
+                for key in keys:
+                    self._cache.pop(key, None)
+
+    def _decode(self, type_, raw):
+        return self._manager._deserialize(type_, raw)
+
+    def get(self, key, default=None):
+        if self._manager._in_transaction():
+            row = self._manager._backend.storage_get(self.name, key)
+            return self._decode(*row) if row else default
+        self._sync_cache()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                gen = None
+            else:
+                gen = self._gen
+        if cached is not None:
+            value, raw = cached
+            if raw is not None:
+                return json.loads(raw)
+            return default if value is _MISSING else value
+
+        row = self._manager._backend.storage_get(self.name, key)
+        value = self._decode(*row) if row else _MISSING
+        # dict/list 缓存原始 JSON，命中时重新解码，避免调用方修改共享对象
+        entry = (None, row[1]) if isinstance(value, (dict, list)) else (value, None)
+        with self._cache_lock:
+            if gen == self._gen and self.cache_size:
+                self._cache[key] = entry
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return default if value is _MISSING else value
+
+    def set(self, key, value):
+        self.set_many({key: value})
+
+    def set_many(self, items):
+        rows = [(key, *self._manager._serialize(value)) for key, value in dict(items).items()]
+        if not rows:
+            return
+        self._manager._backend.storage_put(self.name, rows)
+        self._invalidate([row[0] for row in rows])
+
+    def delete(self, key):
+        self._manager._backend.storage_delete(self.name, [key])
+        self._invalidate([key])
+
+    def clear(self):
+        removed = self._manager._backend.storage_clear(self.name)
+        self._invalidate()
+        return removed
+
+    def scan(self, prefix="", start=None, end=None, limit=None, after=None):
+        # 按键名顺序返回 [(key, value)]；start 含、end 不含，after 用于从上一页的最后一个键之后继续
+        return [
+            (key, self._decode(type_, raw))
+            for key, type_, raw in self._manager._backend.storage_scan(
+                self.name, prefix, start, end, after, limit
+            )
+        ]
+
+    def keys(self, prefix="", start=None, end=None, limit=None):
+        return [key for key, _ in self.scan(prefix, start, end, limit)]
+
+    def items(self, prefix="", start=None, end=None, page_size=100):
+        # 分页迭代，每次只读取 page_size 行，适合遍历大量键
+        after = None
+        while True:
+            page = self.scan(prefix, start, end, page_size, after)
+            yield from page
+            if len(page) < page_size:
+                return
+            after = page[-1][0]
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    async def aget(self, key, default=None):
+        return await self._manager._run_io(self.get, key, default)
+
+    async def aset(self, key, value):
+        await self._manager._run_io(self.set, key, value)
+
+    async def aset_many(self, items):
+        await self._manager._run_io(self.set_many, dict(items))
+
+    async def adelete(self, key):
+        await self._manager._run_io(self.delete, key)
+
+    async def ascan(self, prefix="", start=None, end=None, limit=None, after=None):
+        return await self._manager._run_io(self.scan, prefix, start, end, limit, after)
+
+def _resolve_future(future, error):
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+
 env = EnvManager()
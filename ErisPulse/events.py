@@ -0,0 +1,186 @@
+import asyncio
+import inspect
+import itertools
+import sys
+import threading
+from . import logger
+
+# Python 3.12+ 支持立即开始执行的 Task：没有真正挂起的处理函数不必经过事件循环调度
+_EAGER_TASKS = sys.version_info >= (3, 12)
+
+# 模块间的异步事件总线
+# 事件类型可以是字符串（处理函数收到 data）或类（按事件对象类型的 MRO 查找处理函数，处理函数收到事件对象）
+# 处理函数按优先级从高到低分组派发，同一优先级的处理函数并发执行；单个处理函数的异常只记录日志，不影响其他处理函数
+
+class EventBus:
+    def __init__(self, queue_size=1024, workers=4):
+        # publish() 使用的有界队列长度与派发任务数；workers 为 1 时按发布顺序派发
+        self.queue_size = queue_size
+        self.workers = workers
+        self._handlers = {}
+        self._tokens = {}
+        self._order = itertools.count(1)
+        self._groups = {}
+        self._lock = threading.Lock()
+        self._loop = None
+        self._queue = None
+        self._workers = []
+        self._stats = dict.fromkeys(("emitted", "published", "delivered", "errors", "dropped"), 0)
+
+    def on(self, event_type, handler=None, priority=0):
+        # 返回订阅编号；不传 handler 时作为装饰器使用：@sdk.events.on("message")
+        if handler is None:
+            def decorator(func):
+                self.on(event_type, func, priority)
+                return func
+            return decorator
+        with self._lock:
+            token = next(self._order)
+            self._handlers.setdefault(event_type, {})[token] = (priority, handler)
+            self._tokens[token] = event_type
+            self._groups.clear()
+        return token
+
+    def off(self, token_or_handler):
+        # 传入订阅编号或处理函数（移除该函数的所有订阅），返回移除的订阅数
+        with self._lock:
+            if callable(token_or_handler):
+                tokens = [
+                    token for token, event_type in self._tokens.items()
+                    if self._handlers[event_type][token][1] == token_or_handler
+                ]
+            else:
+                tokens = [token_or_handler] if token_or_handler in self._tokens else []
+            for token in tokens:
+                event_type = self._tokens.pop(token)
+                del self._handlers[event_type][token]
+                if not self._handlers[event_type]:
+                    del self._handlers[event_type]
+            if tokens:
+                self._groups.clear()
+        return len(tokens)
+
+    def handlers(self, event_type):
+        return [handler for group in self._resolve(event_type) for handler in group]
+
+    def _resolve(self, key):
+        # 按优先级分组的处理函数，结果缓存到订阅变化为止
+        groups = self._groups.get(key)
+        if groups is None:
+            with self._lock:
+                keys = key.__mro__ if isinstance(key, type) else (key,)
+                entries = sorted(
+                    ((priority, token, handler) for event_type in keys
+                     for token, (priority, handler) in self._handlers.get(event_type, {}).items()),
+                    key=lambda entry: (-entry[0], entry[1])
+                )
+                groups = tuple(
+                    tuple(handler for _, _, handler in group)
+                    for _, group in itertools.groupby(entries, key=lambda entry: entry[0])
+                )
+                self._groups[key] = groups
+        return groups
+
+    async def emit(self, event, data=None):
+        # 立即派发并等待所有处理函数完成
+        if isinstance(event, str):
+            key, arg = event, data
+        else:
+            key, arg = type(event), event
+        self._stats["emitted"] += 1
+        for group in self._resolve(key):
+            # 先依次调用（同步处理函数在此执行完毕），再并发等待异步处理函数返回的协程
+            pending = []
+            for handler in group:
+                try:
+                    result = handler(arg)
+                except Exception as e:
+                    self._failed(key, handler, e)
+                    continue
+                if inspect.isawaitable(result):
+                    pending.append(self._await(key, handler, result))
+                else:
+                    self._stats["delivered"] += 1
+            if len(pending) == 1:
+                await pending[0]
+            elif pending and _EAGER_TASKS:
+                loop = asyncio.get_running_loop()
+                tasks = [asyncio.Task(coro, loop=loop, eager_start=True) for coro in pending]
+                tasks = [task for task in tasks if not task.done()]
+                if tasks:
+                    await asyncio.gather(*tasks)
+            elif pending:
+                await asyncio.gather(*pending)
+
+    async def _await(self, key, handler, awaitable):
+        try:
+            await awaitable
+            self._stats["delivered"] += 1
+        except Exception as e:
+            self._failed(key, handler, e)
+
+    def _failed(self, key, handler, error):
+        self._stats["errors"] += 1
+        name = key if isinstance(key, str) else key.__name__
+        logger.error(f"事件 {name} 的处理函数 {getattr(handler, '__qualname__', handler)} 出错: {error}")
+
+    async def publish(self, event, data=None):
+        # 放入有界队列后立即返回，由后台任务派发；队列已满时等待空位（背压）
+        await self._ensure_queue().put((event, data))
+        self._stats["published"] += 1
+
+    def publish_nowait(self, event, data=None):
+        # 队列已满时丢弃事件并返回 False
+        try:
+            self._ensure_queue().put_nowait((event, data))
+        except asyncio.QueueFull:
+            self._stats["dropped"] += 1
+            return False
+        self._stats["published"] += 1
+        return True
+
+    def _ensure_queue(self):
+        # 队列与派发任务绑定到第一次发布时的事件循环
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(self.queue_size)
+            self._workers = [loop.create_task(self._dispatch(self._queue)) for _ in range(self.workers)]
+        return self._queue
+
+    async def _dispatch(self, queue):
+        while True:
+            event, data = await queue.get()
+            try:
+                await self.emit(event, data)
+            except Exception as e:
+                logger.error(f"事件派发失败: {e}")
+            finally:
+                queue.task_done()
+
+    async def join(self):
+        # 等待已发布的事件全部派发完成
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def close(self, timeout=None):
+        # 等待队列中的事件派发完成（最多 timeout 秒），然后停止派发任务
+        if self._queue is None:
+            return
+        if self._loop is asyncio.get_running_loop():
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"事件队列在 {timeout}s 内未处理完，剩余 {self._queue.qsize()} 个事件被丢弃")
+            for task in self._workers:
+                task.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._queue = None
+        self._loop = None
+        self._workers = []
+
+    def stats(self):
+        stats = dict(self._stats)
+        stats["queued"] = self._queue.qsize() if self._queue is not None else 0
+        stats["handlers"] = len(self._tokens)
+        return stats
@@ -0,0 +1,172 @@
+import asyncio
+import threading
+
+# 共享的 aiohttp 会话：每个事件循环一个 ClientSession，第一次请求时才导入 aiohttp 并创建
+# 同一事件循环中的所有请求共用连接池、DNS 缓存与 keep-alive 连接
+# settings(key, default) 在创建会话时读取配置：HTTP_LIMIT、HTTP_LIMIT_PER_HOST、HTTP_DNS_CACHE_TTL、HTTP_KEEPALIVE_TIMEOUT
+# 每次请求时读取超时配置：HTTP_TIMEOUT（秒）与 HTTP_MODULE_TIMEOUTS（{模块名: 秒}）
+# 下载文件使用 download_timeout()：HTTP_CONNECT_TIMEOUT 与 HTTP_READ_TIMEOUT（秒）
+# 会话持有其事件循环的强引用，事件循环关闭前（asyncio.run() 等会调用 loop.shutdown_asyncgens()）关闭并移除该循环的会话
+
+class _Requests:
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+
+class HttpClient(_Requests):
+    def __init__(self, settings=None):
+        self.settings = settings
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._stats = dict.fromkeys(
+            ("sessions", "requests", "connections_created", "connections_reused", "dns_cache_hits", "dns_cache_misses"), 0
+        )
+
+    def _setting(self, key, default):
+        value = self.settings(key, default) if self.settings else default
+        return default if value in (None, "") else value
+
+    def session(self):
+        # 返回当前事件循环的共享会话，需要在协程中调用；不要关闭返回的会话，由 close() 统一关闭
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(loop)
+        session = entry[0] if entry is not None else None
+        if session is None or session.closed:
+            import aiohttp
+            connector = aiohttp.TCPConnector(
+                limit=int(self._setting("HTTP_LIMIT", 100)),
+                limit_per_host=int(self._setting("HTTP_LIMIT_PER_HOST", 10)),
+                ttl_dns_cache=int(self._setting("HTTP_DNS_CACHE_TTL", 300)),
+                keepalive_timeout=float(self._setting("HTTP_KEEPALIVE_TIMEOUT", 30)),
+            )
+            session = aiohttp.ClientSession(
+                connector=connector, timeout=self.timeout(), trace_configs=[self._trace_config(aiohttp)]
+            )
+            closer = self._close_on_shutdown(loop, session)
+            with self._lock:
+                self._discard_closed_loops()
+                self._sessions[loop] = (session, closer)
+                self._stats["sessions"] += 1
+            # 同步执行到 yield：第一次迭代时异步生成器登记到事件循环，shutdown_asyncgens() 会调用其 aclose()
+            try:
+                closer.asend(None).send(None)
+            except StopIteration:
+                pass
+        return session
+
+    async def _close_on_shutdown(self, loop, session):
+        try:
+            yield
+        finally:
+            with self._lock:
+                if self._sessions.get(loop, (None,))[0] is session:
+                    del self._sessions[loop]
+            if not session.closed:
+                await session.close()
+
+    def _discard_closed_loops(self):
+        # 调用方持有 _lock；没有经过 shutdown_asyncgens() 就关闭的事件循环，同步关闭其连接器
+        for loop in [loop for loop in self._sessions if loop.is_closed()]:
+            session, _ = self._sessions.pop(loop)
+            if not session.closed:
+                session.connector._close()
+
+    def timeout(self, module=None):
+        # 模块的超时优先取 HTTP_MODULE_TIMEOUTS 中的配置，否则使用 HTTP_TIMEOUT
+        import aiohttp
+        total = self._setting("HTTP_TIMEOUT", 30)
+        if module is not None:
+            total = (self._setting("HTTP_MODULE_TIMEOUTS", {}) or {}).get(module, total)
+        return aiohttp.ClientTimeout(total=float(total) if total else None)
+
+    def download_timeout(self):
+        # 下载大文件时不限制总时长，只限制建立连接与两次读取之间的等待时间
+        import aiohttp
+        return aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=float(self._setting("HTTP_CONNECT_TIMEOUT", 30)),
+            sock_read=float(self._setting("HTTP_READ_TIMEOUT", 60)),
+        )
+
+    def request(self, method, url, **kwargs):
+        # 返回 aiohttp 的请求上下文：async with sdk.http.get(url) as response
+        return self.session().request(method, url, **kwargs)
+
+    def module(self, name, timeout=None):
+        # 带模块超时的请求接口，与其他模块共用连接池
+        return ModuleHttp(self, name, timeout)
+
+    def _trace_config(self, aiohttp):
+        trace = aiohttp.TraceConfig()
+        for signal, key in (
+            (trace.on_request_start, "requests"),
+            (trace.on_connection_create_end, "connections_created"),
+            (trace.on_connection_reuseconn, "connections_reused"),
+            (trace.on_dns_cache_hit, "dns_cache_hits"),
+            (trace.on_dns_cache_miss, "dns_cache_misses"),
+        ):
+            signal.append(self._counter(key))
+        return trace
+
+    def _counter(self, key):
+        async def count(session, context, params):
+            with self._lock:
+                self._stats[key] += 1
+        return count
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["open_sessions"] = sum(1 for session, _ in self._sessions.values() if not session.closed)
+        return stats
+
+    async def close(self):
+        # 关闭所有事件循环中的会话；其他事件循环中的会话在其循环中关闭，循环未运行时同步关闭其连接器
+        current = asyncio.get_running_loop()
+        with self._lock:
+            sessions = [(loop, session) for loop, (session, _) in self._sessions.items()]
+            self._sessions.clear()
+        for loop, session in sessions:
+            if session.closed:
+                continue
+            if loop is current:
+                await session.close()
+            elif loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+            else:
+                session.connector._close()
+
+
+class ModuleHttp(_Requests):
+    def __init__(self, client, name, timeout=None):
+        self.client = client
+        self.name = name
+        self._timeout = timeout
+
+    def session(self):
+        return self.client.session()
+
+    def timeout(self):
+        if self._timeout is not None:
+            import aiohttp
+            return aiohttp.ClientTimeout(total=self._timeout)
+        return self.client.timeout(self.name)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout())
+        return self.client.request(method, url, **kwargs)
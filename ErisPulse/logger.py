@@ -3,16 +3,24 @@ import inspect
 from .envManager import env
 
 _logger = logging.getLogger("RyhBot")
-_log_level = env.get("LOG_LEVEL", "DEBUG")
-if _log_level is None:
-    _log_level = logging.DEBUG
-_logger.setLevel(_log_level)
+_configured = False
 
 if not _logger.handlers:
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(logging.Formatter("%(message)s"))
     _logger.addHandler(console_handler)
 
+def _configure():
+    # LOG_LEVEL 在第一次输出日志时才读取，避免 import 时访问数据库
+    global _configured
+    if _configured:
+        return
+    _configured = True
+    _log_level = env.get("LOG_LEVEL", "DEBUG")
+    if _log_level is None:
+        _log_level = logging.DEBUG
+    _logger.setLevel(_log_level)
+
 def _get_caller():
     frame = inspect.currentframe().f_back.f_back
     module = inspect.getmodule(frame)
@@ -24,25 +32,30 @@ def _get_caller():
     return module_name
 
 def debug(msg, *args, **kwargs):
+    _configure()
     caller_module = _get_caller()
     _logger.debug(f"[{caller_module}] {msg}", *args, **kwargs)
 
 
 def info(msg, *args, **kwargs):
+    _configure()
     caller_module = _get_caller()
     _logger.info(f"[{caller_module}] {msg}", *args, **kwargs)
 
 
 def warning(msg, *args, **kwargs):
+    _configure()
     caller_module = _get_caller()
     _logger.warning(f"[{caller_module}] {msg}", *args, **kwargs)
 
 
 def error(msg, *args, **kwargs):
+    _configure()
     caller_module = _get_caller()
     _logger.error(f"[{caller_module}] {msg}", *args, **kwargs)
 
 
 def critical(msg, *args, **kwargs):
+    _configure()
     caller_module = _get_caller()
     _logger.critical(f"[{caller_module}] {msg}", *args, **kwargs)
\ No newline at end of file
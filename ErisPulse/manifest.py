@@ -0,0 +1,86 @@
+import os
+import json
+import hashlib
+
+# 模块清单缓存：记录每个模块目录已校验的 moduleInfo，目录未变化时无需导入模块即可完成发现与依赖检查
+# 先比较目录 mtime 与文件 (路径, 大小, mtime) 的签名；签名变化时再比较文件内容哈希
+
+def _module_files(path):
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            if not name.endswith((".pyc", ".pyo")):
+                yield os.path.join(root, name)
+
+
+def module_signature(path):
+    digest = hashlib.sha1(str(os.stat(path).st_mtime_ns).encode())
+    for file in _module_files(path):
+        stat = os.stat(file)
+        digest.update(f"{os.path.relpath(file, path)}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def module_digest(path):
+    digest = hashlib.sha256()
+    for file in _module_files(path):
+        digest.update(os.path.relpath(file, path).encode() + b"\0")
+        with open(file, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def validate_module(module_name, moduleObj):
+    # 返回 (moduleInfo, 警告信息)，与 init() 原有的校验规则一致
+    if not hasattr(moduleObj, "moduleInfo") or not isinstance(moduleObj.moduleInfo, dict):
+        return None, f"模块 {module_name} 缺少有效的 'moduleInfo' 字典."
+    if "name" not in moduleObj.moduleInfo.get("meta", {}):
+        return None, f"模块 {module_name} 的 'moduleInfo' 字典 缺少必要 'name' 键."
+    if not hasattr(moduleObj, "Main"):
+        return None, f"模块 {module_name} 缺少 'Main' 类."
+    return moduleObj.moduleInfo, None
+
+
+class ModuleManifest:
+    def __init__(self, env, modules_path):
+        self._env = env
+        self.modules_path = modules_path
+        stored = env.get_module_manifest()
+        self._entries = stored.get("modules", {}) if stored.get("path") == modules_path else {}
+        self._changed = stored.get("path") != modules_path
+        self._pending = {}
+
+    def lookup(self, module_name):
+        # 命中时返回 {"info": ..., "warning": ...}，未命中返回 None
+        path = os.path.join(self.modules_path, module_name)
+        entry = self._entries.get(module_name)
+        signature = module_signature(path)
+        if entry is not None and entry.get("stat") == signature:
+            return entry
+        digest = module_digest(path)
+        if entry is not None and entry.get("hash") == digest:
+            # 仅 mtime 变化（如重新解压），内容一致
+            entry["stat"] = signature
+            self._changed = True
+            return entry
+        self._pending[module_name] = (signature, digest)
+        return None
+
+    def record(self, module_name, info, warning=None):
+        signature, digest = self._pending.pop(module_name)
+        try:
+            # moduleInfo 无法序列化为 JSON 时不缓存，下次启动照常导入
+            info = json.loads(json.dumps(info)) if info is not None else None
+        except (TypeError, ValueError):
+            return
+        self._entries[module_name] = {"stat": signature, "hash": digest, "info": info, "warning": warning}
+        self._changed = True
+
+    def save(self, module_names):
+        for module_name in list(self._entries):
+            if module_name not in module_names:
+                del self._entries[module_name]
+                self._changed = True
+        if self._changed:
+            self._env.set_module_manifest({"path": self.modules_path, "modules": self._entries})
+            self._changed = False
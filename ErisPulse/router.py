@@ -0,0 +1,278 @@
+import re
+import inspect
+import itertools
+import threading
+
+# 消息路由索引：根据消息文本找到对应的命令或正则触发器
+# 命令按字面前缀存入前缀树，匹配注册过的最长命令，命令之后必须是消息结尾或空白字符；正则触发器按 re.match 语义匹配，多个正则同时满足时取最先注册的
+# 以字面前缀开头的正则同样存入前缀树，只检查前缀与消息开头一致的候选；其余正则按注册顺序分批合并为一个分支正则，由命中的分组确定触发器
+# 命令优先于正则触发器
+
+_BATCH_SIZE = 32
+_GLOBAL_FLAGS = re.compile(r"^(?:\(\?[aiLmsux]+\))+")
+_NUMBERED_REFS = re.compile(r"\\[1-9]|\(\?\(\d")
+_SPECIAL = frozenset(".^$*+?{}[]\\|()")
+
+
+def _literal_prefix(pattern):
+    # 保守地提取正则开头的字面文本，任何不确定的情况都返回空字符串
+    if pattern.flags & (re.IGNORECASE | re.VERBOSE):
+        return ""
+    source = _GLOBAL_FLAGS.sub("", pattern.pattern)
+    if _top_level_alternation(source):
+        return ""
+    i = 1 if source.startswith("^") else 0
+    prefix = []
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            char = source[i + 1:i + 2]
+            if not char or char.isalnum():
+                break
+            i += 2
+        elif char in _SPECIAL:
+            break
+        else:
+            i += 1
+        # 后面跟着量词时，该字符可能不出现
+        if source[i:i + 1] in ("*", "?", "{"):
+            break
+        prefix.append(char)
+        if source[i:i + 1] == "+":
+            break
+    return "".join(prefix)
+
+
+def _top_level_alternation(source):
+    depth, escaped, in_class = 0, False, False
+    for char in source:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+    return False
+
+
+def _trie_add(root, key, entry):
+    node = root
+    for char in key:
+        node = node.setdefault(char, {})
+    node.setdefault("", []).append(entry)
+
+
+def _trie_remove(root, key, entry):
+    path, node = [], root
+    for char in key:
+        path.append((node, char))
+        node = node[char]
+    node[""].remove(entry)
+    if not node[""]:
+        del node[""]
+    # 删除不再使用的节点
+    for parent, char in reversed(path):
+        if parent[char]:
+            break
+        del parent[char]
+
+
+class RouteMatch:
+    __slots__ = ("trigger", "handler", "text", "rest", "match")
+
+    def __init__(self, trigger, handler, text, rest, match=None):
+        # trigger 为命令字符串或正则表达式；命令触发时 rest 为命令之后的文本，正则触发时 match 为 re.Match
+        self.trigger = trigger
+        self.handler = handler
+        self.text = text
+        self.rest = rest
+        self.match = match
+
+    @property
+    def args(self):
+        return self.rest.split()
+
+    def __repr__(self):
+        return f"<RouteMatch {self.trigger!r} -> {getattr(self.handler, '__qualname__', self.handler)}>"
+
+
+class Router:
+    def __init__(self):
+        self._order = itertools.count(1)
+        self._lock = threading.Lock()
+        self._commands = {}
+        self._prefixed = {}
+        self._entries = {}
+        self._unindexed = []
+        self._batches = None
+
+    def command(self, name, handler=None):
+        # 返回触发器编号；不传 handler 时作为装饰器使用：@sdk.router.command("/help")
+        if handler is None:
+            return self._decorator(lambda func: self.command(name, func))
+        if not isinstance(name, str) or not name:
+            raise ValueError("命令必须是非空字符串")
+        with self._lock:
+            token = next(self._order)
+            entry = (token, name, handler, None)
+            _trie_add(self._commands, name, entry)
+            self._entries[token] = entry
+        return token
+
+    def regex(self, pattern, handler=None, flags=0):
+        # pattern 可以是字符串或已编译的正则，按 re.match 语义从消息开头匹配
+        if handler is None:
+            return self._decorator(lambda func: self.regex(pattern, func, flags))
+        compiled = re.compile(pattern, flags)
+        if not isinstance(compiled.pattern, str):
+            raise ValueError("正则触发器必须使用 str 类型的表达式")
+        with self._lock:
+            token = next(self._order)
+            entry = (token, compiled, handler, _literal_prefix(compiled))
+            if entry[3]:
+                _trie_add(self._prefixed, entry[3], entry)
+            else:
+                self._unindexed.append(entry)
+                self._batches = None
+            self._entries[token] = entry
+        return token
+
+    def _decorator(self, register):
+        def decorator(func):
+            register(func)
+            return func
+        return decorator
+
+    def off(self, token_or_handler):
+        # 传入触发器编号或处理函数（移除该函数的所有触发器），返回移除的触发器数
+        with self._lock:
+            if callable(token_or_handler):
+                tokens = [token for token, entry in self._entries.items() if entry[2] == token_or_handler]
+            else:
+                tokens = [token_or_handler] if token_or_handler in self._entries else []
+            for token in tokens:
+                entry = self._entries.pop(token)
+                if entry[3] is None:
+                    _trie_remove(self._commands, entry[1], entry)
+                elif entry[3]:
+                    _trie_remove(self._prefixed, entry[3], entry)
+                else:
+                    self._unindexed.remove(entry)
+                    self._batches = None
+        return len(tokens)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def route(self, text):
+        # 返回 RouteMatch，没有触发器匹配时返回 None
+        entry, rest = self._match_command(text)
+        if entry is not None:
+            return RouteMatch(entry[1], entry[2], text, rest)
+        entry, match = self._match_regex(text)
+        if entry is not None:
+            return RouteMatch(entry[1], entry[2], text, text[match.end():], match)
+        return None
+
+    async def dispatch(self, text, *args, **kwargs):
+        # 调用匹配到的处理函数 handler(match, *args, **kwargs)，返回 RouteMatch 或 None
+        match = self.route(text)
+        if match is not None:
+            result = match.handler(match, *args, **kwargs)
+            if inspect.isawaitable(result):
+                await result
+        return match
+
+    def _match_command(self, text):
+        # 沿前缀树前进，记录最后一个（即最长的）后面是消息结尾或空白字符的命令节点
+        node, found, length = self._commands, None, 0
+        for i, char in enumerate(text):
+            node = node.get(char)
+            if node is None:
+                break
+            entries = node.get("")
+            if entries and (i + 1 == len(text) or text[i + 1].isspace()):
+                found, length = entries[0], i + 1
+        if found is None:
+            return None, None
+        return found, text[length:]
+
+    def _match_regex(self, text):
+        best, best_match = None, None
+        # 字面前缀与消息开头一致的候选，按注册顺序检查
+        candidates, node = [], self._prefixed
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            candidates.extend(node.get("", ()))
+        if len(candidates) > 1:
+            candidates.sort(key=lambda entry: entry[0])
+        for entry in candidates:
+            match = entry[1].match(text)
+            if match is not None:
+                best, best_match = entry, match
+                break
+        # 没有字面前缀的正则按批次检查，只需要检查注册早于已匹配候选的批次
+        for first, compiled, members in self._unindexed_batches():
+            if best is not None and first > best[0]:
+                break
+            match = compiled.match(text)
+            if match is None:
+                continue
+            entry = members[0] if len(members) == 1 else members[match.lastindex]
+            if best is None or entry[0] < best[0]:
+                best = entry
+                best_match = match if len(members) == 1 else entry[1].match(text)
+            break
+        return best, best_match
+
+    def _unindexed_batches(self):
+        batches = self._batches
+        if batches is None:
+            with self._lock:
+                batches = self._batches = self._build_batches(list(self._unindexed))
+        return batches
+
+    def _build_batches(self, entries):
+        # 连续的、标志相同且分组名不冲突的正则合并为一个分支正则，用外层分组的编号确定触发器
+        batches, current, names = [], [], set()
+
+        def flush():
+            if len(current) == 1:
+                batches.append((current[0][0], current[0][1], [current[0]]))
+            elif current:
+                # 外层分组最后闭合，命中后 match.lastindex 即为该分支外层分组的编号
+                sources, members, index = [], {}, 1
+                for entry in current:
+                    source = _GLOBAL_FLAGS.sub("", entry[1].pattern)
+                    if entry[1].flags & re.VERBOSE:
+                        source += "\n"
+                    sources.append(f"({source})")
+                    members[index] = entry
+                    index += entry[1].groups + 1
+                batches.append((current[0][0], re.compile("|".join(sources), current[0][1].flags), members))
+            current.clear()
+            names.clear()
+
+        for entry in entries:
+            pattern = entry[1]
+            group_names = set(pattern.groupindex)
+            standalone = _NUMBERED_REFS.search(pattern.pattern) is not None
+            if current and (standalone or len(current) >= _BATCH_SIZE
+                            or pattern.flags != current[0][1].flags or names & group_names):
+                flush()
+            current.append(entry)
+            names.update(group_names)
+            if standalone:
+                flush()
+        flush()
+        return batches
@@ -1,31 +1,448 @@
-from collections import defaultdict, deque
+from collections import deque
 import asyncio
+import functools
+import inspect
+import multiprocessing
 import os
 import shutil
-from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+class DependencyGraph:
+    # 依赖图索引：node -> 依赖 的正向表与 依赖 -> node 的反向表，分层结果缓存到图被修改为止
+    # 图外的依赖不参与排序，可以用 missing() 检查
+    def __init__(self, dependencies=None, error=ValueError):
+        self.error = error
+        self._deps = {}
+        self._rdeps = {}
+        self._levels = None
+        for node, deps in (dependencies or {}).items():
+            self.add(node, deps)
+
+    def add(self, node, dependencies=()):
+        # 已存在的节点会替换其依赖
+        for dep in self._deps.get(node, ()):
+            self._rdeps[dep].pop(node, None)
+        self._deps[node] = list(dict.fromkeys(dependencies))
+        self._rdeps.setdefault(node, {})
+        for dep in self._deps[node]:
+            self._rdeps.setdefault(dep, {})[node] = None
+        self._levels = None
+
+    def remove(self, node):
+        for dep in self._deps.pop(node, ()):
+            self._rdeps[dep].pop(node, None)
+        self._levels = None
+
+    def clear(self):
+        self._deps.clear()
+        self._rdeps.clear()
+        self._levels = None
+
+    def copy(self):
+        return DependencyGraph(self._deps, self.error)
+
+    def __contains__(self, node):
+        return node in self._deps
+
+    def __iter__(self):
+        return iter(self._deps)
+
+    def __len__(self):
+        return len(self._deps)
+
+    def dependencies(self, node):
+        return list(self._deps.get(node, ()))
+
+    def dependents(self, node):
+        # 直接依赖 node 的节点
+        return [dependent for dependent in self._rdeps.get(node, ()) if dependent in self._deps]
+
+    def missing(self):
+        # {节点: [不在图中的依赖]}
+        missing = {}
+        for node, deps in self._deps.items():
+            absent = [dep for dep in deps if dep not in self._deps]
+            if absent:
+                missing[node] = absent
+        return missing
+
+    def all_dependencies(self, node):
+        # node 直接或间接依赖的所有节点（不含 node），按广度优先顺序
+        return self._closure(node, self._deps)
+
+    def all_dependents(self, node):
+        # 直接或间接依赖 node 的所有节点（不含 node），按广度优先顺序
+        return self._closure(node, self._rdeps)
+
+    def _closure(self, node, edges):
+        seen = {node: None}
+        queue = deque([node])
+        while queue:
+            for neighbor in edges.get(queue.popleft(), ()):
+                if neighbor not in seen and neighbor in self._deps:
+                    seen[neighbor] = None
+                    queue.append(neighbor)
+        del seen[node]
+        return list(seen)
+
+    def levels(self):
+        # 按层分组：同一层的节点互不依赖，可以并发处理；存在环时抛出 error，消息中包含环的路径
+        if self._levels is None:
+            in_degree = {node: sum(1 for dep in deps if dep in self._deps) for node, deps in self._deps.items()}
+            level = [node for node, degree in in_degree.items() if degree == 0]
+            levels = []
+            count = 0
+            while level:
+                levels.append(level)
+                count += len(level)
+                next_level = []
+                for node in level:
+                    for dependent in self._rdeps[node]:
+                        if dependent in in_degree:
+                            in_degree[dependent] -= 1
+                            if in_degree[dependent] == 0:
+                                next_level.append(dependent)
+                level = next_level
+            if count != len(self._deps):
+                cycle = self.find_cycle()
+                raise self.error(f"Cycle detected in the dependencies: {' -> '.join(map(str, cycle))}")
+            self._levels = levels
+        return [list(level) for level in self._levels]
+
+    def order(self):
+        return [node for level in self.levels() for node in level]
+
+    def find_cycle(self):
+        # 返回首尾相同的环路径，如 [a, b, c, a]；无环时返回 None。迭代 DFS，避免深层依赖触发递归上限
+        state = {}
+        for root in self._deps:
+            if root in state:
+                continue
+            path = [root]
+            state[root] = 1
+            stack = [iter(self._deps[root])]
+            while stack:
+                for dep in stack[-1]:
+                    if dep not in self._deps:
+                        continue
+                    if state.get(dep) == 1:
+                        return path[path.index(dep):] + [dep]
+                    if dep not in state:
+                        state[dep] = 1
+                        path.append(dep)
+                        stack.append(iter(self._deps[dep]))
+                        break
+                else:
+                    state[path.pop()] = 2
+                    stack.pop()
+        return None
 
-executor = ThreadPoolExecutor()
 
 def topological_sort(elements, dependencies, error):
-    graph = defaultdict(list)
-    in_degree = {element: 0 for element in elements}
-    for element, deps in dependencies.items():
-        for dep in deps:
-            graph[dep].append(element)
-            in_degree[element] += 1
-    queue = deque([element for element in elements if in_degree[element] == 0])
-    sorted_list = []
-    while queue:
-        node = queue.popleft()
-        sorted_list.append(node)
-        for neighbor in graph[node]:
-            in_degree[neighbor] -= 1
-            if in_degree[neighbor] == 0:
-                queue.append(neighbor)
-    if len(sorted_list) != len(elements):
-        raise error(f"Cycle detected in the dependencies: {elements} -> {dependencies}")
-    return sorted_list
+    return [element for level in topological_levels(elements, dependencies, error) for element in level]
+
+def topological_levels(elements, dependencies, error):
+    # 按层分组：同一层的元素互不依赖，可以并发处理
+    graph = DependencyGraph(error=error)
+    for element in elements:
+        graph.add(element, dependencies.get(element, ()))
+    return graph.levels()
+
+class TaskRunner:
+    # 协程任务执行器：调用方处于事件循环中时在该循环上创建任务（可共享会话与锁），否则提交到常驻的后台事件循环线程
+    # max_concurrency 限制同时运行的任务数（按事件循环分别计数），timeout 为默认的单任务超时（秒）
+    def __init__(self, max_concurrency=None, timeout=None, name="ErisPulse-tasks"):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._semaphores = weakref.WeakKeyDictionary()
+        self._tasks = set()
+        self._stats = dict.fromkeys(
+            ("submitted", "waiting", "running", "completed", "failed", "cancelled", "timed_out"), 0
+        )
+        self._total_time = 0.0
+        self._max_time = 0.0
+
+    def submit(self, async_func, *args, timeout=None, **kwargs):
+        # async_func 可以是 async 函数或协程对象；返回可取消的 asyncio.Task（调用方循环）或 concurrent.futures.Future（后台循环）
+        coro = async_func if inspect.iscoroutine(async_func) else async_func(*args, **kwargs)
+        timeout = self.timeout if timeout is None else timeout
+        self._count("submitted")
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = self._background_loop()
+            wrapper = self._execute(coro, timeout)
+            future = asyncio.run_coroutine_threadsafe(wrapper, loop)
+            future.add_done_callback(lambda future: future.cancelled() and self._discard_threadsafe(loop, wrapper, coro))
+            return future
+        wrapper = self._execute(coro, timeout)
+        task = loop.create_task(wrapper)
+        # 保留任务引用，避免未被等待的任务被回收；shutdown() 时一并取消
+        with self._lock:
+            self._tasks.add(task)
+        task.add_done_callback(lambda task: self._task_done(task, wrapper, coro))
+        return task
+
+    def run(self, async_func, *args, timeout=None, **kwargs):
+        # 在同步代码中阻塞等待结果，协程在后台循环中执行
+        loop = self._background_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("不能在 TaskRunner 的后台循环中同步等待任务，请使用 await runner.submit(...)")
+        coro = async_func if inspect.iscoroutine(async_func) else async_func(*args, **kwargs)
+        self._count("submitted")
+        timeout = self.timeout if timeout is None else timeout
+        return asyncio.run_coroutine_threadsafe(self._execute(coro, timeout), loop).result()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            finished = stats["completed"] + stats["failed"] + stats["timed_out"]
+            stats["avg_ms"] = self._total_time / finished * 1000 if finished else 0.0
+            stats["max_ms"] = self._max_time * 1000
+        return stats
+
+    def shutdown(self, wait=True):
+        # 取消调用方循环中未完成的任务，并停止后台循环（其中未完成的任务会被取消）
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+            tasks = list(self._tasks)
+            self._semaphores.clear()
+        for task in tasks:
+            task.get_loop().call_soon_threadsafe(task.cancel)
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(loop.stop)
+            if wait and thread is not threading.current_thread():
+                thread.join()
+
+    def _count(self, key, delta=1):
+        with self._lock:
+            self._stats[key] += delta
+
+    def _task_done(self, task, wrapper, coro):
+        with self._lock:
+            self._tasks.discard(task)
+        self._discard(wrapper, coro)
+
+    def _discard(self, wrapper, coro):
+        # 任务在 _execute 开始前就被取消时（wrapper 已结束而协程仍未启动），关闭协程，避免 "never awaited" 警告
+        if (inspect.getcoroutinestate(wrapper) == inspect.CORO_CLOSED
+                and inspect.getcoroutinestate(coro) == inspect.CORO_CREATED):
+            coro.close()
+            self._count("cancelled")
+
+    def _discard_threadsafe(self, loop, wrapper, coro):
+        # 在后台循环中检查，保证排在任务被取消之后
+        try:
+            loop.call_soon_threadsafe(self._discard, wrapper, coro)
+        except RuntimeError:
+            # 后台循环已关闭
+            self._discard(wrapper, coro)
+
+    def _background_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._run_loop, args=(self._loop,), name=self.name, daemon=True)
+                self._thread.start()
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop):
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+    def _semaphore(self):
+        if not self.max_concurrency:
+            return None
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def _execute(self, coro, timeout):
+        semaphore = self._semaphore()
+        started = False
+        self._count("waiting")
+        try:
+            if semaphore is not None:
+                await semaphore.acquire()
+            self._count("waiting", -1)
+            self._count("running")
+            started = True
+            start = time.perf_counter()
+            status = "failed"
+            try:
+                result = await asyncio.wait_for(coro, timeout) if timeout else await coro
+                status = "completed"
+                return result
+            except asyncio.TimeoutError:
+                status = "timed_out"
+                raise
+            except asyncio.CancelledError:
+                status = "cancelled"
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self._stats["running"] -= 1
+                    self._stats[status] += 1
+                    if status != "cancelled":
+                        self._total_time += elapsed
+                        self._max_time = max(self._max_time, elapsed)
+                if semaphore is not None:
+                    semaphore.release()
+        finally:
+            if not started:
+                # 在等待并发名额时被取消，协程从未开始执行
+                self._count("waiting", -1)
+                self._count("cancelled")
+                coro.close()
+
+runner = TaskRunner()
+
+def _timed_call(func, args, kwargs):
+    # 在工作线程/进程中执行，返回开始与结束时间（time.time()，可跨进程比较）
+    start = time.time()
+    result = func(*args, **kwargs)
+    return start, time.time(), result
+
+class WorkerPools:
+    # 共享的 I/O 线程池与 CPU 进程池，第一次提交任务时才创建
+    # settings(key, default) 在创建线程池时读取配置：WORKER_IO_THREADS、WORKER_CPU_PROCESSES、WORKER_CPU_START_METHOD
+    def __init__(self, settings=None):
+        self.settings = settings
+        self._lock = threading.Lock()
+        self._executors = {}
+        self._stats = {kind: self._empty_stats() for kind in ("io", "cpu")}
+
+    @staticmethod
+    def _empty_stats():
+        return {
+            "workers": 0, "in_flight": 0, "completed": 0, "failed": 0,
+            "wait_total": 0.0, "wait_max": 0.0, "run_total": 0.0, "run_max": 0.0,
+        }
+
+    def _setting(self, key, default):
+        value = self.settings(key, default) if self.settings else default
+        return default if value in (None, "") else value
+
+    def executor(self, kind):
+        # kind 为 "io"（ThreadPoolExecutor）或 "cpu"（ProcessPoolExecutor）
+        with self._lock:
+            executor = self._executors.get(kind)
+            if executor is None:
+                if kind == "io":
+                    workers = int(self._setting("WORKER_IO_THREADS", min(32, (os.cpu_count() or 1) + 4)))
+                    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ErisPulse-io")
+                elif kind == "cpu":
+                    workers = int(self._setting("WORKER_CPU_PROCESSES", os.cpu_count() or 1))
+                    # 未配置时不使用 fork：此时进程中已有 env 的后台线程，fork 出的子进程可能继承被占用的锁而死锁
+                    method = self._setting("WORKER_CPU_START_METHOD", None)
+                    if not method and "forkserver" in multiprocessing.get_all_start_methods():
+                        method = "forkserver"
+                    context = multiprocessing.get_context(method) if method else None
+                    executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+                else:
+                    raise ValueError(f"未知的线程池类型: {kind}")
+                self._executors[kind] = executor
+                self._stats[kind]["workers"] = workers
+            return executor
+
+    async def run_io(self, func, *args, **kwargs):
+        # 在线程池中执行阻塞的 I/O 函数
+        return await self._run("io", func, args, kwargs)
+
+    async def run_cpu(self, func, *args, **kwargs):
+        # 在进程池中执行 CPU 密集的函数，func 与参数需要可以被 pickle（模块顶层定义的函数）
+        return await self._run("cpu", func, args, kwargs)
+
+    async def _run(self, kind, func, args, kwargs):
+        executor = self.executor(kind)
+        stats = self._stats[kind]
+        submitted = time.time()
+        with self._lock:
+            stats["in_flight"] += 1
+        ok = False
+        try:
+            loop = asyncio.get_running_loop()
+            start, end, result = await loop.run_in_executor(
+                executor, functools.partial(_timed_call, func, args, kwargs)
+            )
+            ok = True
+            return result
+        finally:
+            with self._lock:
+                stats["in_flight"] -= 1
+                if ok:
+                    stats["completed"] += 1
+                    wait, elapsed = max(start - submitted, 0.0), end - start
+                    stats["wait_total"] += wait
+                    stats["wait_max"] = max(stats["wait_max"], wait)
+                    stats["run_total"] += elapsed
+                    stats["run_max"] = max(stats["run_max"], elapsed)
+                else:
+                    stats["failed"] += 1
+
+    def stats(self):
+        # queued 为等待空闲工作线程/进程的任务数，时间单位为毫秒
+        result = {}
+        with self._lock:
+            for kind, stats in self._stats.items():
+                completed = stats["completed"]
+                result[kind] = {
+                    "started": kind in self._executors,
+                    "workers": stats["workers"],
+                    "in_flight": stats["in_flight"],
+                    "queued": max(stats["in_flight"] - stats["workers"], 0),
+                    "completed": completed,
+                    "failed": stats["failed"],
+                    "avg_wait_ms": stats["wait_total"] / completed * 1000 if completed else 0.0,
+                    "max_wait_ms": stats["wait_max"] * 1000,
+                    "avg_run_ms": stats["run_total"] / completed * 1000 if completed else 0.0,
+                    "max_run_ms": stats["run_max"] * 1000,
+                }
+        return result
+
+    def shutdown(self, wait=True, cancel=True):
+        # 关闭已创建的线程池与进程池，之后再次提交任务时会重新创建
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=cancel)
+
+pools = WorkerPools()
+
+def __getattr__(name):
+    # util.executor 保留为共享 I/O 线程池的别名，不再在导入时创建
+    if name == "executor":
+        return pools.executor("io")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def ExecAsync(async_func, *args, **kwargs):
-    loop = asyncio.get_event_loop()
-    return loop.run_in_executor(executor, lambda: asyncio.run(async_func(*args, **kwargs)))
\ No newline at end of file
+    # 由共享的 TaskRunner 执行，不再为每次调用创建新的事件循环
+    future = runner.submit(async_func, *args, **kwargs)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # 没有运行中的事件循环时与旧版本一样返回 asyncio Future，可以传给 loop.run_until_complete()
+        return asyncio.wrap_future(future, loop=asyncio.get_event_loop())
+    return future
\ No newline at end of file
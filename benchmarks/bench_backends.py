@@ -0,0 +1,57 @@
+import os
+import sys
+import time
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from ErisPulse.envManager import env
+
+N = int(os.environ.get("BENCH_N", 5000))
+KEYS = int(os.environ.get("BENCH_KEYS", 10000))
+BACKENDS = os.environ.get("BENCH_BACKENDS", "memory,sqlite,dbm").split(",")
+
+
+def timeit(label, func, count=N):
+    start = time.perf_counter()
+    for i in range(count):
+        func(i)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<26} {count / elapsed:>12.0f} ops/s")
+
+
+def bench(name, path):
+    env.use_backend(name, path)
+    backend = env.backend
+    # dbm 的实际实现取决于 Python 编译时可用的库（gnu/ndbm/dumb）
+    implementation = type(backend._db()).__module__ if name == "dbm" else None
+    print(f"[{name}] {implementation or path or '-'}")
+
+    timeit("set", lambda i: env.set(f"bench.{i % KEYS:06d}", i))
+    timeit("set_many (100 keys)", lambda i: env.set_many(
+        {f"bench.{(i * 100 + j) % KEYS:06d}": j for j in range(100)}
+    ), max(N // 100, 1))
+    env.set_many({f"bench.{i:06d}": i for i in range(KEYS)})
+
+    timeit("get (cached)", lambda i: env.get(f"bench.{i % 100:06d}"))
+    timeit("get (backend)", lambda i: backend.get_row(f"bench.{i % KEYS:06d}"))
+    # 每个前缀匹配 100 个键
+    timeit("scan (prefix, 100 keys)", lambda i: env.scan(f"bench.{i % (KEYS // 100):04d}"), 50)
+    timeit("scan (limit 100)", lambda i: env.scan("bench.", limit=100), 50)
+
+    ns = env.namespace("bench")
+    ns.set_many({f"chat:{i:06d}": i for i in range(KEYS)})
+    timeit("namespace get", lambda i: ns.get(f"chat:{i % KEYS:06d}"))
+    timeit("namespace scan (100 keys)", lambda i: ns.scan(f"chat:{i % (KEYS // 100):04d}"), 500)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in BACKENDS:
+            path = None if name == "memory" else os.path.join(tmp, f"config.{name}")
+            bench(name, path)
+        env.close()
+
+
+if __name__ == "__main__":
+    main()
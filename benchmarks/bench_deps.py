@@ -0,0 +1,114 @@
+import os
+import sys
+import time
+import random
+from collections import defaultdict, deque
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ErisPulse.util import DependencyGraph
+
+SIZES = [int(size) for size in os.environ.get("BENCH_NODES", "1000,2000,5000").split(",")]
+MAX_DEPS = int(os.environ.get("BENCH_MAX_DEPS", 3))
+QUERIES = int(os.environ.get("BENCH_QUERIES", 200))
+
+
+def legacy_topological_sort(elements, dependencies):
+    # 原 util.topological_sort 的实现，作为对比基准
+    graph = defaultdict(list)
+    in_degree = {element: 0 for element in elements}
+    for element, deps in dependencies.items():
+        for dep in deps:
+            graph[dep].append(element)
+            in_degree[element] += 1
+    queue = deque([element for element in elements if in_degree[element] == 0])
+    sorted_list = []
+    while queue:
+        node = queue.popleft()
+        sorted_list.append(node)
+        for neighbor in graph[node]:
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                queue.append(neighbor)
+    return sorted_list
+
+
+def legacy_dependents(node, dependencies):
+    # 没有反向索引时只能扫描所有模块的依赖列表
+    result, queue = [], [node]
+    while queue:
+        current = queue.pop()
+        for name, deps in dependencies.items():
+            if current in deps and name not in result:
+                result.append(name)
+                queue.append(name)
+    return result
+
+
+def make_graph(size, seed=0):
+    # 每个节点随机依赖 0..MAX_DEPS 个编号更小的节点，保证无环
+    rng = random.Random(seed)
+    names = [f"mod_{i:05d}" for i in range(size)]
+    dependencies = {}
+    for i, name in enumerate(names):
+        dependencies[name] = rng.sample(names[:i], min(i, rng.randint(0, MAX_DEPS)))
+    return names, dependencies
+
+
+def timed(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def bench(size):
+    names, dependencies = make_graph(size)
+    rng = random.Random(1)
+    # 反向依赖查询选择靠前的节点，它们通常拥有最多的依赖者
+    sample = [names[rng.randrange(max(size // 10, 1))] for _ in range(QUERIES)]
+
+    legacy_check, _ = timed(lambda: [dep in names for deps in dependencies.values() for dep in deps], repeat=1)
+
+    def set_membership():
+        available = set(names)
+        return [dep in available for deps in dependencies.values() for dep in deps]
+
+    set_check, _ = timed(set_membership)
+    legacy_sort, _ = timed(lambda: legacy_topological_sort(names, dependencies))
+    graph_levels, levels = timed(lambda: DependencyGraph(dependencies).levels())
+    graph = DependencyGraph(dependencies)
+    legacy_rdeps, _ = timed(lambda: [legacy_dependents(node, dependencies) for node in sample[:10]], repeat=1)
+    graph_rdeps, _ = timed(lambda: [graph.all_dependents(node) for node in sample[:10]])
+    direct_rdeps, _ = timed(lambda: [graph.dependents(node) for node in sample])
+
+    # 在最深的节点与最浅的节点之间加一条反向边，构成一个贯穿多层的环
+    cyclic = dict(dependencies)
+    cyclic[levels[0][0]] = [levels[-1][0]]
+    cycle_time, cycle = timed(lambda: DependencyGraph(cyclic).find_cycle())
+
+    edges = sum(len(deps) for deps in dependencies.values())
+    print(f"{size} nodes, {edges} edges, {len(levels)} levels")
+    for label, elapsed in [
+        ("membership check (list)", legacy_check),
+        ("membership check (set)", set_check),
+        ("topological_sort (legacy)", legacy_sort),
+        ("DependencyGraph build + levels", graph_levels),
+        ("transitive dependents x10 (scan)", legacy_rdeps),
+        ("transitive dependents x10 (graph)", graph_rdeps),
+        (f"direct dependents x{QUERIES} (graph)", direct_rdeps),
+    ]:
+        print(f"  {label:<36}{elapsed * 1000:>10.2f} ms")
+    print(f"  {'find_cycle':<36}{cycle_time * 1000:>10.2f} ms (path length {len(cycle) - 1})")
+
+
+def main():
+    for size in SIZES:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
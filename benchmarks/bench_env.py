@@ -0,0 +1,58 @@
+import os
+import sys
+import json
+import time
+import sqlite3
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from ErisPulse.envManager import env
+
+N = int(os.environ.get("BENCH_N", 2000))
+
+
+def legacy_get(db_path, key):
+    # 旧实现：每次调用都新建连接
+    with sqlite3.connect(db_path) as conn:
+        row = conn.execute("SELECT value FROM config WHERE key = ?", (key,)).fetchone()
+    if row:
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            return row[0]
+    return None
+
+
+def legacy_set(db_path, key, value):
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)", (key, str(value)))
+    conn.commit()
+    conn.close()
+
+
+def timeit(label, func):
+    start = time.perf_counter()
+    for i in range(N):
+        func(i)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {N / elapsed:>12.0f} ops/s")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "config.db")
+        env.use_backend("sqlite", db_path)
+        env.set("LOG_LEVEL", "INFO")
+
+        timeit("legacy set", lambda i: legacy_set(db_path, f"key{i % 100}", i))
+        timeit("legacy get", lambda i: legacy_get(db_path, "LOG_LEVEL"))
+        timeit("env.set", lambda i: env.set(f"key{i % 100}", i))
+        timeit("env.get", lambda i: env.get("LOG_LEVEL"))
+        env.cache_check_interval = 0
+        timeit("env.get (check every read)", lambda i: env.get("LOG_LEVEL"))
+        env.close()
+
+
+if __name__ == "__main__":
+    main()
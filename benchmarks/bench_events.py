@@ -0,0 +1,86 @@
+import os
+import sys
+import time
+import asyncio
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ErisPulse.events import EventBus
+
+EVENTS = int(os.environ.get("BENCH_EVENTS", 20000))
+HANDLERS = [int(count) for count in os.environ.get("BENCH_HANDLERS", "1,10,100").split(",")]
+QUEUE_SIZE = int(os.environ.get("BENCH_QUEUE_SIZE", 1024))
+WORKERS = int(os.environ.get("BENCH_WORKERS", 4))
+
+
+class Message:
+    def __init__(self, text):
+        self.text = text
+
+
+def make_handlers(count, deliveries, is_async):
+    # 处理函数只做计数，测量的是派发本身的开销
+    def make(i):
+        if is_async:
+            async def handler(event):
+                deliveries[i] += 1
+        else:
+            def handler(event):
+                deliveries[i] += 1
+        return handler
+    return [make(i) for i in range(count)]
+
+
+async def legacy_dispatch(handlers, events):
+    # 适配器模块常见的写法：维护处理函数列表，逐个 await
+    for event in events:
+        for handler in handlers:
+            await handler(event)
+
+
+async def bench_emit(bus, events):
+    for event in events:
+        await bus.emit(event)
+
+
+async def bench_publish(bus, events):
+    for event in events:
+        await bus.publish(event)
+    await bus.join()
+
+
+def run(label, count, coro_factory, deliveries):
+    start = time.perf_counter()
+    asyncio.run(coro_factory())
+    elapsed = time.perf_counter() - start
+    assert sum(deliveries) == EVENTS * count, (sum(deliveries), EVENTS * count)
+    print(f"  {label:<34}{EVENTS / elapsed:>12.0f} events/s  {EVENTS * count / elapsed:>12.0f} deliveries/s")
+
+
+def main():
+    events = [Message(str(i)) for i in range(EVENTS)]
+    print(f"{EVENTS} events, queue {QUEUE_SIZE}, {WORKERS} workers")
+    for count in HANDLERS:
+        print(f"{count} handlers")
+        for is_async in (False, True):
+            kind = "async" if is_async else "sync"
+            if is_async:
+                deliveries = [0] * count
+                handlers = make_handlers(count, deliveries, True)
+                run(f"handler list loop ({kind})", count, lambda: legacy_dispatch(handlers, events), deliveries)
+
+            deliveries = [0] * count
+            bus = EventBus(QUEUE_SIZE, WORKERS)
+            for handler in make_handlers(count, deliveries, is_async):
+                bus.on(Message, handler)
+            run(f"EventBus.emit ({kind})", count, lambda: bench_emit(bus, events), deliveries)
+
+            deliveries = [0] * count
+            bus = EventBus(QUEUE_SIZE, WORKERS)
+            for handler in make_handlers(count, deliveries, is_async):
+                bus.on(Message, handler)
+            run(f"EventBus.publish ({kind})", count, lambda: bench_publish(bus, events), deliveries)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+import asyncio
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import aiohttp
+from aiohttp import web
+from ErisPulse.httpClient import HttpClient
+
+REQUESTS = int(os.environ.get("BENCH_REQUESTS", 2000))
+CONCURRENCY = int(os.environ.get("BENCH_CONCURRENCY", 10))
+PORT = int(os.environ.get("BENCH_PORT", 18766))
+
+
+async def hello(request):
+    return web.Response(text="ok")
+
+
+async def legacy_get(url):
+    # 原 CLI 与模块中的写法：每次请求创建并关闭一个 ClientSession
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as response:
+            return await response.read()
+
+
+async def shared_get(client, url):
+    async with client.get(url) as response:
+        return await response.read()
+
+
+async def run(label, fetch, url):
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one():
+        async with semaphore:
+            await fetch(url)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[one() for _ in range(REQUESTS)])
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<34}{elapsed * 1000:>10.1f} ms  {REQUESTS / elapsed:>10.0f} req/s")
+    return elapsed
+
+
+async def main():
+    app = web.Application()
+    app.router.add_get("/", hello)
+    server = web.AppRunner(app, access_log=None)
+    await server.setup()
+    await web.TCPSite(server, "127.0.0.1", PORT).start()
+    url = f"http://127.0.0.1:{PORT}/"
+    print(f"{REQUESTS} requests, concurrency {CONCURRENCY}")
+    try:
+        client = HttpClient()
+        legacy = await run("ClientSession per request", legacy_get, url)
+        shared = await run("sdk.http (shared session)", lambda url: shared_get(client, url), url)
+        stats = client.stats()
+        print(f"  speedup {legacy / shared:.1f}x, connections created {stats['connections_created']}, "
+              f"reused {stats['connections_reused']}")
+        await client.close()
+    finally:
+        await server.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,54 @@
+import os
+import sys
+import subprocess
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+RUNS = int(os.environ.get("BENCH_RUNS", 5))
+# 设置后作为回归门槛：import ErisPulse 的累计耗时超过该值（毫秒）时以非零状态退出
+MAX_MS = float(os.environ.get("BENCH_MAX_IMPORT_MS", 0))
+
+
+def import_time(env):
+    # 解析 -X importtime 的输出，返回 {模块: (自身耗时, 累计耗时)}，单位微秒
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import ErisPulse"],
+        cwd=env["BENCH_CWD"], env=env, capture_output=True, text=True, check=True
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "config.db")
+        env = dict(os.environ)
+        env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+        env["ERISPULSE_ENV_PATH"] = db_path
+        env["BENCH_CWD"] = tmp
+
+        runs = [import_time(env) for _ in range(RUNS)]
+        # import 不应打开数据库，也不应执行 env.py
+        side_effects = os.path.exists(db_path)
+
+    totals = sorted(run["ErisPulse"][1] for run in runs)
+    best = runs[[run["ErisPulse"][1] for run in runs].index(totals[0])]
+    print(f"import ErisPulse: best {totals[0] / 1000:.1f} ms, median {totals[len(totals) // 2] / 1000:.1f} ms")
+    print("slowest modules (self time, best run):")
+    for name, (self_us, cumulative_us) in sorted(best.items(), key=lambda item: -item[1][0])[:10]:
+        print(f"  {name:<40} {self_us / 1000:>8.1f} ms {cumulative_us / 1000:>8.1f} ms")
+    print(f"database created during import: {side_effects}")
+
+    if side_effects or (MAX_MS and totals[len(totals) // 2] / 1000 > MAX_MS):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
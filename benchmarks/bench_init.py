@@ -0,0 +1,77 @@
+import os
+import sys
+import subprocess
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+MODULES = int(os.environ.get("BENCH_MODULES", 24))
+LEVELS = int(os.environ.get("BENCH_LEVELS", 3))
+# 模拟导入与构造的耗时（毫秒）；time.sleep 会释放 GIL，对应加载原生扩展、读取文件或网络握手等场景
+IMPORT_MS = float(os.environ.get("BENCH_IMPORT_MS", 40))
+CONSTRUCT_MS = float(os.environ.get("BENCH_CONSTRUCT_MS", 20))
+
+MODULE_TEMPLATE = '''import time
+time.sleep({import_s})
+
+moduleInfo = {{
+    "meta": {{"name": "{name}", "version": "1.0.0", "description": "", "author": "bench"}},
+    "dependencies": {{"requires": {requires!r}, "optional": [], "pip": []}}
+}}
+
+class Main:
+    def __init__(self, sdk):
+        time.sleep({construct_s})
+'''
+
+RUNNER = '''import sys, time
+import ErisPulse
+ErisPulse.sdkModulePath = sys.argv[1]
+start = time.perf_counter()
+ErisPulse.init(parallel=sys.argv[2] == "1")
+print(time.perf_counter() - start)
+'''
+
+
+def make_modules(path):
+    # 按层生成模块，每个模块依赖上一层的一个模块
+    per_level = max(MODULES // LEVELS, 1)
+    for i in range(MODULES):
+        level = min(i // per_level, LEVELS - 1)
+        requires = [f"bench_mod_{i - per_level:03d}"] if level else []
+        module_dir = os.path.join(path, f"bench_mod_{i:03d}")
+        os.makedirs(module_dir)
+        with open(os.path.join(module_dir, "__init__.py"), "w", encoding="utf-8") as f:
+            f.write(MODULE_TEMPLATE.format(
+                name=f"bench_mod_{i:03d}", requires=requires,
+                import_s=IMPORT_MS / 1000, construct_s=CONSTRUCT_MS / 1000
+            ))
+
+
+def run(path, parallel):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    env["ERISPULSE_ENV_BACKEND"] = "memory"
+    result = subprocess.run(
+        [sys.executable, "-c", RUNNER, path, "1" if parallel else "0"],
+        env=env, capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1]), result.stderr
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        make_modules(tmp)
+        sequential, _ = run(tmp, False)
+        parallel, log = run(tmp, True)
+
+    print(f"{MODULES} modules, {LEVELS} levels, import {IMPORT_MS}ms, construct {CONSTRUCT_MS}ms")
+    print(f"  sequential init    {sequential * 1000:>10.1f} ms")
+    print(f"  parallel init      {parallel * 1000:>10.1f} ms")
+    print(f"  saved              {(sequential - parallel) * 1000:>10.1f} ms ({sequential / parallel:.1f}x)")
+    for line in log.splitlines():
+        if "并行初始化" in line:
+            print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
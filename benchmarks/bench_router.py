@@ -0,0 +1,97 @@
+import os
+import re
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ErisPulse.router import Router
+
+SIZES = [int(size) for size in os.environ.get("BENCH_TRIGGERS", "10,1000,10000").split(",")]
+MESSAGES = int(os.environ.get("BENCH_MESSAGES", 2000))
+# 没有字面前缀的正则所占比例，它们无法进入前缀树，只能分批合并检查
+UNINDEXED = float(os.environ.get("BENCH_UNINDEXED", 0.05))
+
+
+def handler(match):
+    pass
+
+
+def make_triggers(size, rng):
+    # 一半是命令，一半是正则；命令与正则的字面前缀各不相同
+    commands = [f"/cmd{i}" for i in range(size // 2)]
+    patterns = []
+    for i in range(size - len(commands)):
+        if rng.random() < UNINDEXED:
+            patterns.append(re.compile(rf"(\w+)的天气{i}$"))
+        else:
+            patterns.append(re.compile(rf"查询{i}\s+(\w+)$"))
+    return commands, patterns
+
+
+def make_messages(size, commands, patterns, rng):
+    messages = []
+    for _ in range(MESSAGES):
+        kind = rng.randrange(4)
+        if kind == 0:
+            messages.append(f"{rng.choice(commands)} arg")
+        elif kind == 1:
+            messages.append(f"查询{rng.randrange(size)} 北京")
+        elif kind == 2:
+            messages.append(f"上海的天气{rng.randrange(size)}")
+        else:
+            messages.append("一条不匹配任何触发器的普通消息")
+    return messages
+
+
+def legacy_route(commands, patterns, text):
+    # 逐个检查所有命令前缀与正则
+    for command in commands:
+        if text.startswith(command) and (len(text) == len(command) or text[len(command)].isspace()):
+            return command
+    for pattern in patterns:
+        if pattern.match(text):
+            return pattern
+    return None
+
+
+def bench(size):
+    rng = random.Random(size)
+    commands, patterns = make_triggers(size, rng)
+    messages = make_messages(size, commands, patterns, rng)
+    # 旧写法按注册顺序取第一个匹配的命令，这里让较长的命令排在前面，与 Router 的最长匹配一致
+    ordered = sorted(commands, key=len, reverse=True)
+
+    router = Router()
+    start = time.perf_counter()
+    for command in commands:
+        router.command(command, handler)
+    for pattern in patterns:
+        router.regex(pattern, handler)
+    router.route("")
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [legacy_route(ordered, patterns, text) for text in messages]
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    routed = [router.route(text) for text in messages]
+    indexed = time.perf_counter() - start
+
+    for want, got in zip(expected, routed):
+        assert want == (got.trigger if got is not None else None), (want, got)
+    matched = sum(1 for match in routed if match is not None)
+    print(f"{size} triggers, {MESSAGES} messages ({matched} matched), index built in {build * 1000:.1f} ms")
+    print(f"  {'linear scan':<16}{legacy / MESSAGES * 1e6:>10.2f} us/message")
+    print(f"  {'Router.route':<16}{indexed / MESSAGES * 1e6:>10.2f} us/message  {legacy / indexed:>8.1f}x")
+
+
+def main():
+    for size in SIZES:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
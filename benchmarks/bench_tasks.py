@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ErisPulse.util import TaskRunner
+
+CALLS = int(os.environ.get("BENCH_CALLS", 2000))
+SLEEP_MS = float(os.environ.get("BENCH_SLEEP_MS", 1))
+CONCURRENCY = int(os.environ.get("BENCH_CONCURRENCY", 64))
+
+executor = ThreadPoolExecutor()
+
+
+def legacy_exec_async(async_func, *args, **kwargs):
+    # 原 util.ExecAsync 的实现：每次调用在线程池中执行 asyncio.run()，创建并销毁一个事件循环
+    loop = asyncio.get_event_loop()
+    return loop.run_in_executor(executor, lambda: asyncio.run(async_func(*args, **kwargs)))
+
+
+async def job(i):
+    await asyncio.sleep(SLEEP_MS / 1000)
+    return i
+
+
+async def run_legacy():
+    return await asyncio.gather(*[legacy_exec_async(job, i) for i in range(CALLS)])
+
+
+async def run_caller_loop(runner):
+    return await asyncio.gather(*[runner.submit(job, i) for i in range(CALLS)])
+
+
+def run_background(runner):
+    futures = [runner.submit(job, i) for i in range(CALLS)]
+    return [future.result() for future in futures]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    assert sorted(result) == list(range(CALLS))
+    return time.perf_counter() - start
+
+
+def main():
+    unbounded = TaskRunner()
+    bounded = TaskRunner(max_concurrency=CONCURRENCY)
+    results = [
+        ("ExecAsync (legacy, loop per call)", timed(lambda: asyncio.run(run_legacy()))),
+        ("TaskRunner caller loop", timed(lambda: asyncio.run(run_caller_loop(unbounded)))),
+        (f"TaskRunner caller loop, max {CONCURRENCY}", timed(lambda: asyncio.run(run_caller_loop(bounded)))),
+        ("TaskRunner background loop", timed(lambda: run_background(unbounded))),
+        (f"TaskRunner background loop, max {CONCURRENCY}", timed(lambda: run_background(bounded))),
+    ]
+    baseline = results[0][1]
+    print(f"{CALLS} calls, {SLEEP_MS}ms await each")
+    for label, elapsed in results:
+        print(f"  {label:<40}{elapsed * 1000:>10.1f} ms  {CALLS / elapsed:>10.0f} calls/s  {baseline / elapsed:>6.1f}x")
+    stats = unbounded.stats()
+    print(f"  runner stats: completed {stats['completed']}, avg {stats['avg_ms']:.2f}ms, max {stats['max_ms']:.2f}ms")
+    unbounded.shutdown()
+    bounded.shutdown()
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()